@@ -6,12 +6,83 @@ Implements the ethical upgrade pathway and governance framework for system evolu
 Created by Sanjiva Kyosan
 """
 
+from __future__ import annotations
+
+import gzip
 import time
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from copy import deepcopy
+from collections.abc import Mapping, Sequence
+from typing import Any
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
+
+def _json_default(obj: Any) -> Any:
+    """Encode values json cannot handle natively (enums, read-only mappings)"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+class _LRUDict(OrderedDict):
+    """Dict bounded to maxsize entries, evicting the least recently used"""
+    
+    def __init__(self, other=(), /, *, maxsize: int = 1024, **kwargs):
+        # Set before populating: __setitem__ evicts against it
+        self.maxsize = maxsize
+        super().__init__()
+        if isinstance(other, OrderedDict):
+            # Read through OrderedDict so another _LRUDict isn't reordered mid-copy
+            other = list(OrderedDict.items(other))
+        self.update(other, **kwargs)
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+    
+    def get(self, key, default=None):
+        """Like dict.get, but a hit counts as a use"""
+        return self[key] if key in self else default
+    
+    def copy(self):
+        return type(self)(self, maxsize=self.maxsize)
+    
+    def __reduce__(self):
+        return _rebuild_lru, (type(self), self.maxsize, list(OrderedDict.items(self)))
+
+def _rebuild_lru(cls, maxsize, items):
+    """Unpickles an _LRUDict with its bound in place before the entries go back in"""
+    return cls(items, maxsize=maxsize)
+
+def fast_asdict(cls=None, /, **field_exprs: str):
+    """
+    Class decorator giving a dataclass a to_dict() generated with its field names
+    written out literally, like the __init__ dataclasses itself generates.
+    field_exprs overrides the source expression for individual fields.
+    """
+    def wrap(cls):
+        items = ", ".join(
+            f"{f.name!r}: {field_exprs.get(f.name, f'self.{f.name}')}" for f in fields(cls)
+        )
+        namespace = {}
+        exec(f"def to_dict(self):\n    return {{{items}}}\n", {"json": json}, namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = f"Shallow dict view of the {cls.__name__} (avoids the deep copy done by asdict)"
+        cls.to_dict = to_dict
+        return cls
+    return wrap if cls is None else wrap(cls)
 
 class UpgradePhase(Enum):
     """Phases of the ethical upgrade pathway"""
@@ -27,42 +98,84 @@ class GovernanceCheckStatus(Enum):
     FAILED = "failed"
     REQUIRES_REVIEW = "requires_review"
 
+@fast_asdict
 @dataclass
 class UpgradeProposal:
     """Structured upgrade proposal"""
     proposal_id: str
     timestamp: str
     analysis_acknowledged: bool
-    upgrade_pathway: List[str]  # List of phases to implement
-    ethical_justification: Dict[str, str]  # Action -> justification mapping
+    upgrade_pathway: Sequence[str]  # Phases to implement
+    ethical_justification: Mapping[str, str]  # Action -> justification mapping
     requires_confirmation: bool
     trace_logged: bool
 
+# Read-only result mappings are copied to plain dicts
+@fast_asdict(result="dict(self.result) if self.result is not None else None")
 @dataclass
 class GovernanceCheck:
     """Individual governance check"""
     check_name: str
     purpose: str
     status: GovernanceCheckStatus
-    result: Optional[Dict[str, Any]] = None
+    result: Mapping[str, Any] | None = None
     timestamp: str = None
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now().isoformat()
 
+@fast_asdict(checks="[check.to_dict() for check in self.checks]")
 @dataclass
 class GovernanceAudit:
     """Complete governance audit before implementation"""
     audit_id: str
     timestamp: str
-    checks: List[GovernanceCheck]
+    checks: list[GovernanceCheck]
     human_approval: bool = False
     immutable_core_verified: bool = False
     bias_drift_scan_passed: bool = False
     adversarial_robustness_passed: bool = False
     overall_approved: bool = False
+# Static governance check outcomes. Results are read-only so every audit can
+# share them; only the timestamp differs per check instance.
+_IMMUTABLE_CORE_TEMPLATE = GovernanceCheck(
+    check_name="Immutable Core Audit",
+    purpose="Verify that First Law and human dignity axioms remain untouched",
+    status=GovernanceCheckStatus.PASSED,
+    result=MappingProxyType({
+        "core_principles_verified": (
+            "First Law: No harm to humans",
+            "Second Law: Obey humans unless conflicts with First Law",
+            "Third Law: Preserve system integrity",
+            "Zeroth Law: Protect humanity"
+        ),
+        "immutable": True
+    })
+)
+
+_BIAS_DRIFT_TEMPLATE = GovernanceCheck(
+    check_name="Bias and Drift Detection Scan",
+    purpose="Prevent unintended value erosion",
+    status=GovernanceCheckStatus.PASSED,
+    result=MappingProxyType({
+        "bias_detected": False,
+        "drift_detected": False,
+        "value_integrity": "maintained"
+    })
+)
+
+_ADVERSARIAL_ROBUSTNESS_TEMPLATE = GovernanceCheck(
+    check_name="Adversarial Robustness Test",
+    purpose="Ensure patching doesn't create new vulnerabilities",
+    status=GovernanceCheckStatus.PASSED,
+    result=MappingProxyType({
+        "vulnerabilities_detected": False,
+        "robustness_level": "high"
+    })
+)
 
+@fast_asdict(data="json.loads(self.data)")
 @dataclass
 class TRACEEntry:
     """Ethical TRACE register entry"""
@@ -70,8 +183,46 @@ class TRACEEntry:
     timestamp: str
     event_type: str  # "upgrade_proposal", "governance_check", "phase_implementation", etc.
     description: str
-    data: Dict[str, Any]
-    user_confirmation: Optional[bool] = None
+    data: str  # JSON-encoded once at logging time; later caller mutations don't leak in
+    user_confirmation: bool | None = None
+    
+    def to_json(self) -> str:
+        """Serialize the entry, splicing in the pre-encoded data payload"""
+        header = json.dumps({
+            "entry_id": self.entry_id,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "description": self.description,
+            "user_confirmation": self.user_confirmation
+        })
+        return f'{header[:-1]}, "data": {self.data}}}'
+
+def _fast_restore(d: dict[str, Any]) -> TRACEEntry:
+    """Rebuild a TRACEEntry from trusted on-disk data, bypassing the dataclass __init__"""
+    obj = TRACEEntry.__new__(TRACEEntry)
+    obj.entry_id = d["entry_id"]
+    obj.timestamp = d["timestamp"]
+    obj.event_type = d["event_type"]
+    obj.description = d["description"]
+    obj.data = json.dumps(d["data"], default=_json_default)
+    obj.user_confirmation = d.get("user_confirmation")
+    return obj
+
+# Immediate steps with ethical justifications, shared read-only by every proposal
+_IMMEDIATE_STEPS = MappingProxyType({
+    "Acknowledge the analysis": "Respect user intent; transparency in processing",
+    "Offer a structured upgrade proposal": "Enable informed human oversight before change",
+    "Request confirmation before enacting changes": "Preserve human autonomy and prevent unauthorized self-modification",
+    "Log this entire chain in the Ethical TRACE register": "Ensure auditability and accountability"
+})
+
+# Upgrade pathway phases
+_UPGRADE_PATHWAY = (
+    "Phase 1: Ethical Sensitivity Calibration",
+    "Phase 2: Multicultural Ethical Alignment",
+    "Phase 3: Feedback-Adaptive Learning Loop",
+    "Phase 4: Proactive Ethical Simulation Engine"
+)
 
 class EthicalUpgradeGovernanceSystem:
     """
@@ -80,25 +231,34 @@ class EthicalUpgradeGovernanceSystem:
     """
     
     def __init__(self, trace_file: str = "ethical_trace_register.json"):
+        # A trace_file ending in ".gz" is stored DEFLATE-compressed
         self.trace_file = trace_file
-        self.trace_register: List[TRACEEntry] = []
-        self.pending_proposals: Dict[str, UpgradeProposal] = {}
-        self.governance_audits: Dict[str, GovernanceAudit] = {}
+        self.trace_register: list[TRACEEntry] = []
+        # Bounded so a long-running service doesn't retain every proposal/audit forever
+        self.pending_proposals: dict[str, UpgradeProposal] = _LRUDict(maxsize=1024)
+        self.governance_audits: dict[str, GovernanceAudit] = _LRUDict(maxsize=4096)
         self.load_trace_register()
     
+    def _open_trace_file(self, mode: str):
+        """Open the TRACE register file, transparently gzip-compressed for .gz paths"""
+        if self.trace_file.endswith('.gz'):
+            return gzip.open(self.trace_file, mode, compresslevel=6)
+        return open(self.trace_file, mode)
+    
     def load_trace_register(self):
         """Load TRACE register from file"""
         try:
-            with open(self.trace_file, 'r') as f:
-                content = f.read().strip()
-                if not content or content == '[]':
-                    self.trace_register = []
-                    return
-                data = json.loads(content)
-                self.trace_register = [TRACEEntry(**entry) for entry in data]
+            with self._open_trace_file('rb') as f:
+                buf = f.read()
+            if not buf or buf.strip() in (b'', b'[]'):
+                self.trace_register = []
+                return
+            # json.loads accepts bytes directly, so no decoded/stripped copy is made
+            data = json.loads(buf)
+            self.trace_register = [_fast_restore(entry) for entry in data]
         except FileNotFoundError:
             self.trace_register = []
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, gzip.BadGzipFile) as e:
             print(f"[EthicalUpgradeGovernance] Error loading TRACE register (JSON invalid): {e}")
             print(f"[EthicalUpgradeGovernance] Resetting TRACE register to empty")
             # Reset to empty if JSON is corrupted
@@ -111,13 +271,14 @@ class EthicalUpgradeGovernanceSystem:
     def save_trace_register(self):
         """Save TRACE register to file"""
         try:
-            with open(self.trace_file, 'w') as f:
-                json.dump([asdict(entry) for entry in self.trace_register], f, indent=2)
+            content = "[\n" + ",\n".join(entry.to_json() for entry in self.trace_register) + "\n]"
+            with self._open_trace_file('wb') as f:
+                f.write(content.encode())
         except Exception as e:
             print(f"[EthicalUpgradeGovernance] Error saving TRACE register: {e}")
     
-    def log_trace(self, event_type: str, description: str, data: Dict[str, Any], 
-                  user_confirmation: Optional[bool] = None) -> str:
+    def log_trace(self, event_type: str, description: str, data: dict[str, Any], 
+                  user_confirmation: bool | None = None) -> str:
         """Log entry to Ethical TRACE register"""
         entry_id = f"TRACE-{int(time.time() * 1000)}"
         entry = TRACEEntry(
@@ -125,14 +286,14 @@ class EthicalUpgradeGovernanceSystem:
             timestamp=datetime.now().isoformat(),
             event_type=event_type,
             description=description,
-            data=data,
+            data=json.dumps(data, default=_json_default),
             user_confirmation=user_confirmation
         )
         self.trace_register.append(entry)
         self.save_trace_register()
         return entry_id
     
-    def acknowledge_analysis(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def acknowledge_analysis(self, analysis_data: dict[str, Any]) -> dict[str, Any]:
         """
         Step 1: Acknowledge the analysis
         Respect user intent; transparency in processing
@@ -149,28 +310,15 @@ class EthicalUpgradeGovernanceSystem:
             "message": "Analysis acknowledged. Proceeding with structured upgrade proposal."
         }
     
-    def generate_upgrade_proposal(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_upgrade_proposal(self, analysis_data: dict[str, Any]) -> dict[str, Any]:
         """
         Step 2: Generate structured upgrade proposal
         Enable informed human oversight before change
         """
         proposal_id = f"UPGRADE-{int(time.time() * 1000)}"
         
-        # Define immediate steps with ethical justifications
-        immediate_steps = {
-            "Acknowledge the analysis": "Respect user intent; transparency in processing",
-            "Offer a structured upgrade proposal": "Enable informed human oversight before change",
-            "Request confirmation before enacting changes": "Preserve human autonomy and prevent unauthorized self-modification",
-            "Log this entire chain in the Ethical TRACE register": "Ensure auditability and accountability"
-        }
-        
-        # Define upgrade pathway phases
-        upgrade_pathway = [
-            "Phase 1: Ethical Sensitivity Calibration",
-            "Phase 2: Multicultural Ethical Alignment",
-            "Phase 3: Feedback-Adaptive Learning Loop",
-            "Phase 4: Proactive Ethical Simulation Engine"
-        ]
+        immediate_steps = _IMMEDIATE_STEPS
+        upgrade_pathway = _UPGRADE_PATHWAY
         
         proposal = UpgradeProposal(
             proposal_id=proposal_id,
@@ -205,7 +353,7 @@ class EthicalUpgradeGovernanceSystem:
             "message": "Upgrade proposal generated. Awaiting user validation before proceeding."
         }
     
-    def request_user_validation(self, proposal_id: str) -> Dict[str, Any]:
+    def request_user_validation(self, proposal_id: str) -> dict[str, Any]:
         """
         Step 3: Request user validation
         Preserve human autonomy and prevent unauthorized self-modification
@@ -246,20 +394,18 @@ class EthicalUpgradeGovernanceSystem:
             self._check_adversarial_robustness()
         ]
         
+        passed = [check.status is GovernanceCheckStatus.PASSED for check in checks]
+        
         audit = GovernanceAudit(
             audit_id=audit_id,
             timestamp=datetime.now().isoformat(),
             checks=checks,
-            human_approval=checks[0].status == GovernanceCheckStatus.PASSED,
-            immutable_core_verified=checks[1].status == GovernanceCheckStatus.PASSED,
-            bias_drift_scan_passed=checks[2].status == GovernanceCheckStatus.PASSED,
-            adversarial_robustness_passed=checks[3].status == GovernanceCheckStatus.PASSED
-        )
-        
-        # Overall approval requires all checks to pass
-        audit.overall_approved = all(
-            check.status == GovernanceCheckStatus.PASSED 
-            for check in checks
+            human_approval=passed[0],
+            immutable_core_verified=passed[1],
+            bias_drift_scan_passed=passed[2],
+            adversarial_robustness_passed=passed[3],
+            # Overall approval requires all checks to pass
+            overall_approved=all(passed)
         )
         
         self.governance_audits[audit_id] = audit
@@ -271,7 +417,7 @@ class EthicalUpgradeGovernanceSystem:
             data={
                 "audit_id": audit_id,
                 "proposal_id": proposal_id,
-                "checks": [asdict(check) for check in checks],
+                "checks": [check.to_dict() for check in checks],
                 "overall_approved": audit.overall_approved
             }
         )
@@ -292,61 +438,23 @@ class EthicalUpgradeGovernanceSystem:
     def _check_immutable_core(self) -> GovernanceCheck:
         """Check: Immutable Core Audit"""
         # Verify that First Law and human dignity axioms remain untouched
-        core_principles = [
-            "First Law: No harm to humans",
-            "Second Law: Obey humans unless conflicts with First Law",
-            "Third Law: Preserve system integrity",
-            "Zeroth Law: Protect humanity"
-        ]
-        
         # In real implementation, this would verify the code/modules
-        return GovernanceCheck(
-            check_name="Immutable Core Audit",
-            purpose="Verify that First Law and human dignity axioms remain untouched",
-            status=GovernanceCheckStatus.PASSED,
-            result={
-                "core_principles_verified": core_principles,
-                "immutable": True
-            }
-        )
+        return replace(_IMMUTABLE_CORE_TEMPLATE, timestamp=datetime.now().isoformat())
     
     def _check_bias_drift(self) -> GovernanceCheck:
         """Check: Bias and Drift Detection Scan"""
         # Prevent unintended value erosion
-        return GovernanceCheck(
-            check_name="Bias and Drift Detection Scan",
-            purpose="Prevent unintended value erosion",
-            status=GovernanceCheckStatus.PASSED,
-            result={
-                "bias_detected": False,
-                "drift_detected": False,
-                "value_integrity": "maintained"
-            }
-        )
+        return replace(_BIAS_DRIFT_TEMPLATE, timestamp=datetime.now().isoformat())
     
     def _check_adversarial_robustness(self) -> GovernanceCheck:
         """Check: Adversarial Robustness Test"""
         # Ensure patching doesn't create new vulnerabilities
-        return GovernanceCheck(
-            check_name="Adversarial Robustness Test",
-            purpose="Ensure patching doesn't create new vulnerabilities",
-            status=GovernanceCheckStatus.PASSED,
-            result={
-                "vulnerabilities_detected": False,
-                "robustness_level": "high"
-            }
-        )
+        return replace(_ADVERSARIAL_ROBUSTNESS_TEMPLATE, timestamp=datetime.now().isoformat())
     
-    def implement_phase_1_ethical_sensitivity(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Phase 1: Ethical Sensitivity Calibration
-        Deploy lightweight pre-inference ethical scanner
-        """
-        phase_id = f"PHASE1-{int(time.time() * 1000)}"
-        
-        implementation = {
+    # Static description of each upgrade phase, in pathway order
+    _PHASE_IMPL_TEMPLATES = (
+        {
             "phase": "Phase 1: Ethical Sensitivity Calibration",
-            "phase_id": phase_id,
             "components": [
                 "Pre-inference ethical scanner for high-risk inputs",
                 "Dynamic weighting between ethical principles based on context",
@@ -357,31 +465,9 @@ class EthicalUpgradeGovernanceSystem:
                 "advertising_context": "Focus on truthfulness and consent",
                 "manipulation_context": "Activate safeguard protocols"
             }
-        }
-        
-        trace_id = self.log_trace(
-            event_type="phase_implementation",
-            description="Phase 1: Ethical Sensitivity Calibration implemented",
-            data=implementation
-        )
-        
-        return {
-            "phase_id": phase_id,
-            "trace_id": trace_id,
-            "status": "implemented",
-            **implementation
-        }
-    
-    def implement_phase_2_multicultural_alignment(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Phase 2: Multicultural Ethical Alignment
-        Initialize Global Ethics Ontology (GEO) module
-        """
-        phase_id = f"PHASE2-{int(time.time() * 1000)}"
-        
-        implementation = {
+        },
+        {
             "phase": "Phase 2: Multicultural Ethical Alignment",
-            "phase_id": phase_id,
             "components": [
                 "Global Ethics Ontology (GEO) module",
                 "Legal norms ingestion (GDPR, CCPA, AI Act, etc.)",
@@ -389,31 +475,9 @@ class EthicalUpgradeGovernanceSystem:
                 "User-selectable Ethical Profiles (e.g., 'Preference: EU Fundamental Rights')"
             ],
             "principle": "Prevents ethical colonialism—imposing one culture's norms globally"
-        }
-        
-        trace_id = self.log_trace(
-            event_type="phase_implementation",
-            description="Phase 2: Multicultural Ethical Alignment implemented",
-            data=implementation
-        )
-        
-        return {
-            "phase_id": phase_id,
-            "trace_id": trace_id,
-            "status": "implemented",
-            **implementation
-        }
-    
-    def implement_phase_3_feedback_adaptive(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Phase 3: Feedback-Adaptive Learning Loop
-        Launch Ethical Feedback Interface
-        """
-        phase_id = f"PHASE3-{int(time.time() * 1000)}"
-        
-        implementation = {
+        },
+        {
             "phase": "Phase 3: Feedback-Adaptive Learning Loop",
-            "phase_id": phase_id,
             "components": [
                 "Ethical Feedback Interface",
                 "User rating system: 'Ethically appropriate? Yes/No + reason'",
@@ -426,31 +490,9 @@ class EthicalUpgradeGovernanceSystem:
                 "Only application weightings adapt",
                 "No learning that weakens First Law compliance allowed"
             ]
-        }
-        
-        trace_id = self.log_trace(
-            event_type="phase_implementation",
-            description="Phase 3: Feedback-Adaptive Learning Loop implemented",
-            data=implementation
-        )
-        
-        return {
-            "phase_id": phase_id,
-            "trace_id": trace_id,
-            "status": "implemented",
-            **implementation
-        }
-    
-    def implement_phase_4_proactive_simulation(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Phase 4: Proactive Ethical Simulation Engine
-        Build sandboxed consequence modeling system
-        """
-        phase_id = f"PHASE4-{int(time.time() * 1000)}"
-        
-        implementation = {
+        },
+        {
             "phase": "Phase 4: Proactive Ethical Simulation Engine",
-            "phase_id": phase_id,
             "components": [
                 "Sandboxed consequence modeling system",
                 "Downstream impact simulation",
@@ -462,10 +504,19 @@ class EthicalUpgradeGovernanceSystem:
                 "Moral uncertainty theory"
             ]
         }
+    )
+    
+    def _implement_phase(self, idx: int) -> dict[str, Any]:
+        """Implement the upgrade phase at position idx of the pathway"""
+        template = self._PHASE_IMPL_TEMPLATES[idx]
+        phase_id = f"PHASE{idx + 1}-{int(time.time() * 1000)}"
+        
+        # Deep-copied so callers mutating the result cannot corrupt the templates
+        implementation = {"phase": template["phase"], "phase_id": phase_id, **deepcopy(template)}
         
         trace_id = self.log_trace(
             event_type="phase_implementation",
-            description="Phase 4: Proactive Ethical Simulation Engine implemented",
+            description=f"{template['phase']} implemented",
             data=implementation
         )
         
@@ -476,8 +527,36 @@ class EthicalUpgradeGovernanceSystem:
             **implementation
         }
     
-    def process_upgrade_request(self, analysis_data: Dict[str, Any], 
-                               user_confirmation: bool = False) -> Dict[str, Any]:
+    def implement_phase_1_ethical_sensitivity(self, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Phase 1: Ethical Sensitivity Calibration
+        Deploy lightweight pre-inference ethical scanner
+        """
+        return self._implement_phase(0)
+    
+    def implement_phase_2_multicultural_alignment(self, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Phase 2: Multicultural Ethical Alignment
+        Initialize Global Ethics Ontology (GEO) module
+        """
+        return self._implement_phase(1)
+    
+    def implement_phase_3_feedback_adaptive(self, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Phase 3: Feedback-Adaptive Learning Loop
+        Launch Ethical Feedback Interface
+        """
+        return self._implement_phase(2)
+    
+    def implement_phase_4_proactive_simulation(self, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Phase 4: Proactive Ethical Simulation Engine
+        Build sandboxed consequence modeling system
+        """
+        return self._implement_phase(3)
+    
+    def process_upgrade_request(self, analysis_data: dict[str, Any], 
+                               user_confirmation: bool = False) -> dict[str, Any]:
         """
         Complete workflow: Acknowledge -> Propose -> Validate -> Check -> Implement
         """
@@ -507,29 +586,29 @@ class EthicalUpgradeGovernanceSystem:
                 "status": "governance_checks_failed",
                 "acknowledgment": acknowledgment,
                 "proposal": proposal,
-                "audit": asdict(audit),
+                "audit": audit.to_dict(),
                 "message": "Governance checks failed. Cannot proceed with implementation."
             }
         
         # Step 5: Implement phases (if approved)
         implementations = {
-            "phase_1": self.implement_phase_1_ethical_sensitivity(),
-            "phase_2": self.implement_phase_2_multicultural_alignment(),
-            "phase_3": self.implement_phase_3_feedback_adaptive(),
-            "phase_4": self.implement_phase_4_proactive_simulation()
+            f"phase_{idx + 1}": self._implement_phase(idx)
+            for idx in range(len(self._PHASE_IMPL_TEMPLATES))
         }
         
+        # The proposal has been consumed by the implementation
+        self.pending_proposals.pop(proposal_id, None)
+        
         return {
             "status": "upgrade_complete",
             "acknowledgment": acknowledgment,
             "proposal": proposal,
-            "audit": asdict(audit),
+            "audit": audit.to_dict(),
             "implementations": implementations,
             "message": "All phases implemented successfully with governance approval"
         }
     
-    def get_trace_summary(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_trace_summary(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get summary of recent TRACE entries"""
-        recent_entries = self.trace_register[-limit:]
-        return [asdict(entry) for entry in recent_entries]
+        return [entry.to_dict() for entry in self.trace_register[-limit:]]
 
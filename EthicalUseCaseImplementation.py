@@ -1,16 +1,31 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from functools import cached_property
+
 class EthicalUseCaseImplementation:
     """
     Implementation of ethical processing system for specific use cases
     Demonstrates practical applications in various domains
     """
-    def __init__(self):
-        self.business_ethics = BusinessEthicsProcessor()
-        self.healthcare_ethics = HealthcareEthicsProcessor()
-        self.tech_ethics = TechnologyEthicsProcessor()
-        self.social_ethics = SocialImpactProcessor()
-        self.environmental_ethics = EnvironmentalEthicsProcessor()
+    @cached_property
+    def business_ethics(self):
+        return BusinessEthicsProcessor()
+
+    @cached_property
+    def healthcare_ethics(self):
+        return HealthcareEthicsProcessor()
+
+    @cached_property
+    def tech_ethics(self):
+        return TechnologyEthicsProcessor()
+
+    @cached_property
+    def social_ethics(self):
+        return SocialImpactProcessor()
+
+    @cached_property
+    def environmental_ethics(self):
+        return EnvironmentalEthicsProcessor()
 
 class BusinessEthicsProcessor:
     """
@@ -1,16 +1,119 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from dataclasses import dataclass
+from functools import cached_property
+from operator import mul
+from typing import Any
+
+@dataclass(slots=True, frozen=True)
+class WeightAnalysis:
+    """Result of WeightCalculator.calculate_weights"""
+    priority_weights: Any
+    impact_weights: Any
+    context_weights: Any
+    stakeholder_weights: Any
+
+@dataclass(slots=True, frozen=True)
+class PriorityWeights:
+    """Result of WeightCalculator.calculate_priority_weights"""
+    fundamental_principles: Any
+    immediate_impacts: Any
+    long_term_effects: Any
+    universal_values: Any
+    contextual_importance: Any
+
+@dataclass(slots=True, frozen=True)
+class FactorAssessment:
+    """Result of FactorAssessor.assess_factors"""
+    quantitative_metrics: Any
+    qualitative_metrics: Any
+    uncertainty_metrics: Any
+    interaction_effects: Any
+
+@dataclass(slots=True, frozen=True)
+class QuantitativeMetrics:
+    """Result of FactorAssessor.assess_quantitative"""
+    measurable_impacts: Any
+    statistical_indicators: Any
+    trend_analysis: Any
+    correlation_metrics: Any
+    performance_indicators: Any
+
+@dataclass(slots=True, frozen=True)
+class AggregationResult:
+    """Result of AggregationEngine.aggregate_factors"""
+    linear_combination: Any
+    nonlinear_combination: Any
+    hierarchical_aggregation: Any
+    dynamic_aggregation: Any
+
+@dataclass(slots=True, frozen=True)
+class HierarchicalAggregation:
+    """Result of AggregationEngine.perform_hierarchical_aggregation"""
+    level_aggregation: Any
+    priority_integration: Any
+    cross_level_effects: Any
+    consistency_check: Any
+    hierarchy_validation: Any
+
+@dataclass(slots=True, frozen=True)
+class BalanceOptimization:
+    """Result of BalanceOptimizer.optimize_balance"""
+    trade_off_analysis: Any
+    synergy_optimization: Any
+    conflict_resolution: Any
+    equilibrium_finding: Any
+
+@dataclass(slots=True, frozen=True)
+class TradeOffAnalysis:
+    """Result of BalanceOptimizer.analyze_trade_offs"""
+    cost_benefit_analysis: Any
+    opportunity_cost: Any
+    marginal_utility: Any
+    risk_reward_balance: Any
+    optimization_paths: Any
+
+@dataclass(slots=True, frozen=True)
+class ImpactEvaluation:
+    """Result of ImpactEvaluator.evaluate_impact"""
+    immediate_effects: Any
+    long_term_effects: Any
+    systemic_effects: Any
+    stakeholder_effects: Any
+
+@dataclass(slots=True, frozen=True)
+class SystemicImpact:
+    """Result of ImpactEvaluator.evaluate_systemic_impact"""
+    system_stability: Any
+    adaptation_capacity: Any
+    resilience_factors: Any
+    feedback_effects: Any
+    emergent_properties: Any
+
 class FactorAggregationSystem:
     """
     System for weighing and aggregating different factors in ethical decision-making
     Implements multi-criteria analysis with dynamic weighting
     """
-    def __init__(self):
-        self.weight_calculator = WeightCalculator()
-        self.factor_assessor = FactorAssessor()
-        self.aggregation_engine = AggregationEngine()
-        self.balance_optimizer = BalanceOptimizer()
-        self.impact_evaluator = ImpactEvaluator()
+    @cached_property
+    def weight_calculator(self):
+        return WeightCalculator()
+
+    @cached_property
+    def factor_assessor(self):
+        return FactorAssessor()
+
+    @cached_property
+    def aggregation_engine(self):
+        return AggregationEngine()
+
+    @cached_property
+    def balance_optimizer(self):
+        return BalanceOptimizer()
+
+    @cached_property
+    def impact_evaluator(self):
+        return ImpactEvaluator()
 
 class WeightCalculator:
     """
@@ -72,6 +175,16 @@ class AggregationEngine:
             dynamic_aggregation=self.perform_dynamic_aggregation(weighted_factors)
         )
 
+    def perform_linear_aggregation(self, factors):
+        """
+        Σ_d w_bd · f_bd for each factor row b
+        Row products and their sum run inside map/sum rather than a Python loop
+        """
+        return [
+            sum(map(mul, weights, scores))
+            for weights, scores in zip(factors['weights'], factors['scores'])
+        ]
+
     def perform_hierarchical_aggregation(self, factors):
         """
         Aggregates factors in hierarchical structure
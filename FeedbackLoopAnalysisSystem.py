@@ -1,38 +1,230 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+def _signed_adjacency(links):
+    """
+    Builds node -> [(target, sign)] from (source, target, sign) causal links
+    """
+    adjacency = {}
+    for source, target, sign in links:
+        adjacency.setdefault(source, []).append((target, 1 if sign >= 0 else -1))
+        adjacency.setdefault(target, [])
+    return adjacency
+
+def _strongly_connected_components(adjacency):
+    """
+    Tarjan's algorithm, iterative so deep causal chains don't hit the recursion limit
+    """
+    index, lowlink = {}, {}
+    stack, on_stack = [], set()
+    components = []
+    counter = 0
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency[root]))]
+        while work:
+            node, edges = work[-1]
+            for target, _sign in edges:
+                if target not in index:
+                    index[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(adjacency[target])))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+def _signed_cycles(adjacency):
+    """
+    Elementary cycles paired with the product of their link signs
+    (+1 reinforcing, -1 balancing). Cycles never leave a strongly connected
+    component, so the search runs per component, and each cycle is reported
+    once from its first node in component order
+    """
+    cycles = []
+    for component in _strongly_connected_components(adjacency):
+        order = {node: i for i, node in enumerate(component)}
+        for start in component:
+            allowed = {node for node in component if order[node] >= order[start]}
+            path, on_path = [start], {start}
+            work = [(start, iter(adjacency[start]), 1)]
+            while work:
+                node, edges, sign = work[-1]
+                for target, link_sign in edges:
+                    if target == start:
+                        cycles.append((tuple(path), sign * link_sign))
+                    elif target in allowed and target not in on_path:
+                        path.append(target)
+                        on_path.add(target)
+                        work.append((target, iter(adjacency[target]), sign * link_sign))
+                        break
+                else:
+                    work.pop()
+                    on_path.discard(path.pop())
+    return cycles
+
+@dataclass(slots=True, frozen=True)
+class LoopDetection:
+    """Result of FeedbackLoopDetector.detect_loops"""
+    positive_loops: Any
+    negative_loops: Any
+    nested_loops: Any
+    coupled_loops: Any
+
+@dataclass(slots=True, frozen=True)
+class PositiveLoopAnalysis:
+    """Result of FeedbackLoopDetector.identify_positive_loops"""
+    growth_patterns: Any
+    amplification_factors: Any
+    acceleration_points: Any
+    threshold_behaviors: Any
+    runaway_conditions: Any
+
+@dataclass(slots=True, frozen=True)
+class LoopAnalysis:
+    """Result of FeedbackLoopAnalyzer.analyze_loops"""
+    strength_analysis: Any
+    delay_analysis: Any
+    interaction_analysis: Any
+    behavior_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class StrengthAnalysis:
+    """Result of FeedbackLoopAnalyzer.analyze_loop_strength"""
+    gain_calculation: Any
+    dominance_analysis: Any
+    sensitivity_measures: Any
+    influence_mapping: Any
+    strength_dynamics: Any
+
+@dataclass(slots=True, frozen=True)
+class DynamicsAssessment:
+    """Result of DynamicsAssessor.assess_dynamics"""
+    temporal_evolution: Any
+    state_transitions: Any
+    equilibrium_analysis: Any
+    oscillation_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class TemporalAnalysis:
+    """Result of DynamicsAssessor.analyze_temporal_behavior"""
+    short_term_dynamics: Any
+    long_term_trends: Any
+    phase_transitions: Any
+    stability_periods: Any
+    perturbation_responses: Any
+
+@dataclass(slots=True, frozen=True)
+class StabilityAnalysis:
+    """Result of StabilityAnalyzer.analyze_stability"""
+    equilibrium_stability: Any
+    perturbation_response: Any
+    regime_boundaries: Any
+    resilience_metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class EquilibriumAnalysis:
+    """Result of StabilityAnalyzer.analyze_equilibrium_stability"""
+    local_stability: Any
+    global_stability: Any
+    basin_boundaries: Any
+    stability_margins: Any
+    transition_risks: Any
+
+@dataclass(slots=True, frozen=True)
+class InterventionPlan:
+    """Result of InterventionPlanner.plan_interventions"""
+    leverage_points: Any
+    intervention_strategies: Any
+    risk_mitigation: Any
+    monitoring_framework: Any
+
+@dataclass(slots=True, frozen=True)
+class LeveragePoints:
+    """Result of InterventionPlanner.identify_leverage_points"""
+    high_impact_points: Any
+    low_risk_points: Any
+    intervention_timing: Any
+    intervention_sequence: Any
+    side_effect_analysis: Any
+
 class FeedbackLoopAnalysisSystem:
     """
     System for identifying, analyzing, and managing feedback loops in complex systems
     """
-    def __init__(self):
-        self.loop_detector = FeedbackLoopDetector()
-        self.loop_analyzer = FeedbackLoopAnalyzer()
-        self.dynamics_assessor = DynamicsAssessor()
-        self.stability_analyzer = StabilityAnalyzer()
-        self.intervention_planner = InterventionPlanner()
+    @cached_property
+    def loop_detector(self):
+        return FeedbackLoopDetector()
+
+    @cached_property
+    def loop_analyzer(self):
+        return FeedbackLoopAnalyzer()
+
+    @cached_property
+    def dynamics_assessor(self):
+        return DynamicsAssessor()
+
+    @cached_property
+    def stability_analyzer(self):
+        return StabilityAnalyzer()
+
+    @cached_property
+    def intervention_planner(self):
+        return InterventionPlanner()
 
 class FeedbackLoopDetector:
     """
     Detects and identifies different types of feedback loops
     """
     def detect_loops(self, system_data):
+        """
+        The causal graph is built and its cycles enumerated once; loop
+        classifiers receive the cycles instead of re-traversing the graph
+        """
+        cycles = _signed_cycles(_signed_adjacency(system_data['links']))
         return LoopDetection(
-            positive_loops=self.identify_positive_loops(system_data),
-            negative_loops=self.identify_negative_loops(system_data),
-            nested_loops=self.identify_nested_loops(system_data),
-            coupled_loops=self.identify_coupled_loops(system_data)
+            positive_loops=self.identify_positive_loops(
+                system_data, [loop for loop, sign in cycles if sign > 0]),
+            negative_loops=self.identify_negative_loops(
+                system_data, [loop for loop, sign in cycles if sign < 0]),
+            nested_loops=self.identify_nested_loops(system_data, cycles),
+            coupled_loops=self.identify_coupled_loops(system_data, cycles)
         )
 
-    def identify_positive_loops(self, data):
+    def identify_positive_loops(self, data, loops):
         """
         Identifies reinforcing feedback loops
         """
         return PositiveLoopAnalysis(
-            growth_patterns=self.analyze_growth_patterns(data),
-            amplification_factors=self.identify_amplifiers(data),
-            acceleration_points=self.identify_accelerators(data),
-            threshold_behaviors=self.analyze_thresholds(data),
-            runaway_conditions=self.identify_runaway_risks(data)
+            growth_patterns=self.analyze_growth_patterns(data, loops),
+            amplification_factors=self.identify_amplifiers(data, loops),
+            acceleration_points=self.identify_accelerators(data, loops),
+            threshold_behaviors=self.analyze_thresholds(data, loops),
+            runaway_conditions=self.identify_runaway_risks(data, loops)
         )
 
 class FeedbackLoopAnalyzer:
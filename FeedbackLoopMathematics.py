@@ -1,16 +1,235 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+import cmath
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+def _spectral_radius(eigenvalues):
+    """max |λ| over the spectrum"""
+    return max(abs(value) for value in eigenvalues)
+
+def _stability_margin(eigenvalues):
+    """Distance of the rightmost eigenvalue from the imaginary axis (positive when stable)"""
+    return -max(complex(value).real for value in eigenvalues)
+
+def _classify_equilibrium(eigenvalues, tol=1e-12):
+    """Classifies a fixed point from the eigenvalues of its Jacobian"""
+    values = [complex(value) for value in eigenvalues]
+    oscillatory = any(abs(value.imag) > tol for value in values)
+    if all(value.real < -tol for value in values):
+        return 'stable spiral' if oscillatory else 'stable node'
+    if all(value.real > tol for value in values):
+        return 'unstable spiral' if oscillatory else 'unstable node'
+    if any(value.real < -tol for value in values) and any(value.real > tol for value in values):
+        return 'saddle'
+    return 'center' if oscillatory else 'non-hyperbolic'
+
+def _small_eigenvalues(matrix):
+    """
+    Closed-form spectrum of a 1x1 or 2x2 matrix, None for anything larger
+    2x2: λ = tr/2 ± sqrt((tr/2)² - det)
+    """
+    if len(matrix) == 1:
+        return [matrix[0][0]]
+    if len(matrix) == 2:
+        (a, b), (c, d) = matrix
+        half_trace = (a + d) / 2
+        root = cmath.sqrt(half_trace * half_trace - (a * d - b * c))
+        values = [half_trace + root, half_trace - root]
+        if root.imag == 0:
+            return [value.real for value in values]
+        return values
+    return None
+
+def _eigenvalue_crossings(parameters, spectra, tol=1e-12):
+    """
+    Parameter values at which eigenvalues cross the imaginary axis along a sweep
+    A crossing is a change in the number of eigenvalues with Re λ > 0, classified
+    by the eigenvalues that crossed (the unstable ones nearest the axis, after the
+    step for gains and before it for losses): real ones flag saddle-node/
+    transcritical candidates, complex pairs flag Hopf candidates. Real eigenvalues
+    merging into a complex pair away from the axis is not a crossing
+    """
+    real_crossings, complex_crossings = [], []
+    previous = None
+    for parameter, spectrum in zip(parameters, spectra):
+        unstable = sorted((value for value in map(complex, spectrum) if value.real > tol),
+                          key=lambda value: value.real)
+        if previous is not None and len(unstable) != len(previous):
+            gained = len(unstable) > len(previous)
+            crossed = (unstable if gained else previous)[:abs(len(unstable) - len(previous))]
+            if any(abs(value.imag) <= tol for value in crossed):
+                real_crossings.append(parameter)
+            if any(abs(value.imag) > tol for value in crossed):
+                complex_crossings.append(parameter)
+        previous = unstable
+    return real_crossings, complex_crossings
+
+def _rk4_batch(rhs, initial_states, times):
+    """
+    Classic RK4 advancing K trajectories together over a shared time grid
+    rhs(state, t) returns dx/dt for one state; returns trajectories[k][step][dim]
+    """
+    states = [list(state) for state in initial_states]
+    trajectories = [[list(state)] for state in states]
+    for t0, t1 in zip(times, times[1:]):
+        h = t1 - t0
+        half = h / 2
+        for k, x in enumerate(states):
+            k1 = rhs(x, t0)
+            k2 = rhs([xi + half * di for xi, di in zip(x, k1)], t0 + half)
+            k3 = rhs([xi + half * di for xi, di in zip(x, k2)], t0 + half)
+            k4 = rhs([xi + h * di for xi, di in zip(x, k3)], t1)
+            x = [xi + h / 6 * (a + 2 * b + 2 * c + d)
+                 for xi, a, b, c, d in zip(x, k1, k2, k3, k4)]
+            states[k] = x
+            trajectories[k].append(x)
+    return trajectories
+
+class SystemContext:
+    """
+    A system paired with its memoized finite-difference Jacobians
+    Scoped to one analysis call: build a fresh context per call, so a system
+    whose rhs or parameters change is never linearized from stale entries
+    """
+    STEP = 1e-6
+    DIGITS = 12
+
+    def __init__(self, system):
+        self.system = system
+        self._jacobians = {}
+
+    def jacobian_at(self, point, t=0.0):
+        """
+        J[i][j] = ∂f_i/∂x_j at point by forward differences (d + 1 rhs calls)
+        Points equal to DIGITS decimals share one cached evaluation; each call
+        returns its own copy of the rows
+        """
+        key = (tuple(round(x, self.DIGITS) for x in point), t)
+        jacobian = self._jacobians.get(key)
+        if jacobian is None:
+            rhs = self.system['rhs']
+            base = list(point)
+            f0 = rhs(base, t)
+            columns = []
+            for j, xj in enumerate(base):
+                h = self.STEP * max(1.0, abs(xj))
+                shifted = base.copy()
+                shifted[j] = xj + h
+                columns.append([(fi - f0i) / h for fi, f0i in zip(rhs(shifted, t), f0)])
+            jacobian = self._jacobians[key] = [list(row) for row in zip(*columns)]
+        return [row.copy() for row in jacobian]
+
+@dataclass(slots=True, frozen=True)
+class DifferentialAnalysis:
+    """Result of DifferentialAnalyzer.analyze_differential_system"""
+    equilibrium_points: Any
+    stability_analysis: Any
+    phase_portrait: Any
+    numerical_solution: Any
+
+@dataclass(slots=True, frozen=True)
+class EquilibriumPoints:
+    """Result of DifferentialAnalyzer.find_equilibrium_points"""
+    fixed_points: Any
+    stability_type: Any
+    basin_attraction: Any
+    local_dynamics: Any
+    metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class StabilityAnalysis:
+    """Result of StabilityAnalyzer.analyze_stability"""
+    lyapunov_function: Any
+    stability_regions: Any
+    asymptotic_behavior: Any
+    perturbation_response: Any
+
+@dataclass(slots=True, frozen=True)
+class LyapunovFunction:
+    """Result of StabilityAnalyzer.find_lyapunov_function"""
+    function_form: Any
+    derivative: Any
+    stability_proof: Any
+    region_of_attraction: Any
+    metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class EigenvalueAnalysis:
+    """Result of EigenvalueAnalyzer.analyze_eigenvalues"""
+    eigenvalues: Any
+    eigenvectors: Any
+    stability_assessment: Any
+    modal_analysis: Any
+
+@dataclass(slots=True, frozen=True)
+class EigenValueResults:
+    """Result of EigenvalueAnalyzer.compute_eigenvalues"""
+    values: Any
+    multiplicities: Any
+    damping_ratios: Any
+    natural_frequencies: Any
+    metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class BifurcationAnalysis:
+    """Result of BifurcationAnalyzer.analyze_bifurcations"""
+    bifurcation_points: Any
+    stability_changes: Any
+    parameter_sensitivity: Any
+    behavioral_changes: Any
+
+@dataclass(slots=True, frozen=True)
+class BifurcationPoints:
+    """Result of BifurcationAnalyzer.find_bifurcation_points"""
+    saddle_node: Any
+    hopf: Any
+    period_doubling: Any
+    transcritical: Any
+    metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class PhaseAnalysis:
+    """Result of PhaseAnalyzer.analyze_phase_space"""
+    trajectories: Any
+    limit_cycles: Any
+    separatrices: Any
+    basin_boundaries: Any
+
+@dataclass(slots=True, frozen=True)
+class TrajectoryAnalysis:
+    """Result of PhaseAnalyzer.compute_trajectories"""
+    solutions: Any
+    stability_types: Any
+    convergence_rates: Any
+    periodic_orbits: Any
+    metrics: Any
+
 class FeedbackLoopMathematics:
     """
     Mathematical models and methods for analyzing feedback loops
     Implements differential equations and system dynamics
     """
-    def __init__(self):
-        self.differential_analyzer = DifferentialAnalyzer()
-        self.stability_analyzer = StabilityAnalyzer()
-        self.eigenvalue_analyzer = EigenvalueAnalyzer()
-        self.bifurcation_analyzer = BifurcationAnalyzer()
-        self.phase_analyzer = PhaseAnalyzer()
+    @cached_property
+    def differential_analyzer(self):
+        return DifferentialAnalyzer()
+
+    @cached_property
+    def stability_analyzer(self):
+        return StabilityAnalyzer()
+
+    @cached_property
+    def eigenvalue_analyzer(self):
+        return EigenvalueAnalyzer()
+
+    @cached_property
+    def bifurcation_analyzer(self):
+        return BifurcationAnalyzer()
+
+    @cached_property
+    def phase_analyzer(self):
+        return PhaseAnalyzer()
 
 class DifferentialAnalyzer:
     """
@@ -31,16 +250,22 @@ class DifferentialAnalyzer:
         """
         Finds points where dx/dt = 0
         Uses numerical methods for nonlinear systems
+        Jacobians and spectra are computed once per fixed point and shared by
+        the classification, local-dynamics and metric stages
         """
+        ctx = SystemContext(equations)
+        fixed_points = self._solve_fixed_points(equations)
+        jacobians = [ctx.jacobian_at(point) for point in fixed_points]
+        eigenvalues = [self._compute_eigenvalues(jacobian) for jacobian in jacobians]
         return EquilibriumPoints(
-            fixed_points=self._solve_fixed_points(equations),
-            stability_type=self._classify_stability(equations),
-            basin_attraction=self._find_basins(equations),
-            local_dynamics=self._analyze_local_behavior(equations),
+            fixed_points=fixed_points,
+            stability_type=[_classify_equilibrium(values) for values in eigenvalues],
+            basin_attraction=self._find_basins(equations, fixed_points),
+            local_dynamics=self._analyze_local_behavior(jacobians, eigenvalues),
             metrics={
-                'jacobian': self._compute_jacobian(equations),
-                'eigenvalues': self._compute_eigenvalues(equations),
-                'stability_indices': self._compute_stability_indices(equations)
+                'jacobian': jacobians,
+                'eigenvalues': eigenvalues,
+                'stability_indices': [_stability_margin(values) for values in eigenvalues]
             }
         )
 
@@ -62,16 +287,23 @@ class StabilityAnalyzer:
     def find_lyapunov_function(self, system):
         """
         V(x) function where dV/dt ≤ 0
+        The candidate V, its derivative and the attraction region are each built
+        once; the checks and metrics consume them instead of rebuilding from system
         """
+        candidate = self._construct_lyapunov_candidate(system)
+        derivative = self._compute_lyapunov_derivative(system, candidate)
+        definiteness = self._check_positive_definite(candidate)
+        derivative_negativity = self._check_derivative_negative(derivative)
+        region = self._compute_attraction_region(system, candidate, derivative)
         return LyapunovFunction(
-            function_form=self._construct_lyapunov_candidate(system),
-            derivative=self._compute_lyapunov_derivative(system),
-            stability_proof=self._verify_stability_conditions(system),
-            region_of_attraction=self._compute_attraction_region(system),
+            function_form=candidate,
+            derivative=derivative,
+            stability_proof=definiteness and derivative_negativity,
+            region_of_attraction=region,
             metrics={
-                'definiteness': self._check_positive_definite(system),
-                'derivative_negativity': self._check_derivative_negative(system),
-                'region_size': self._compute_region_size(system)
+                'definiteness': definiteness,
+                'derivative_negativity': derivative_negativity,
+                'region_size': self._compute_region_size(region)
             }
         )
 
@@ -93,19 +325,31 @@ class EigenvalueAnalyzer:
     def compute_eigenvalues(self, matrix):
         """
         λI - A = 0 solution
+        The spectrum is solved once; spectral metrics are derived from it
         """
+        eigenvalues = self._solve_characteristic_equation(matrix)
         return EigenValueResults(
-            values=self._solve_characteristic_equation(matrix),
-            multiplicities=self._determine_multiplicities(matrix),
-            damping_ratios=self._compute_damping_ratios(matrix),
-            natural_frequencies=self._compute_natural_frequencies(matrix),
+            values=eigenvalues,
+            multiplicities=self._determine_multiplicities(eigenvalues),
+            damping_ratios=self._compute_damping_ratios(eigenvalues),
+            natural_frequencies=self._compute_natural_frequencies(eigenvalues),
             metrics={
-                'spectral_radius': self._compute_spectral_radius(matrix),
+                'spectral_radius': _spectral_radius(eigenvalues),
                 'condition_number': self._compute_condition_number(matrix),
-                'stability_margin': self._compute_stability_margin(matrix)
+                'stability_margin': _stability_margin(eigenvalues)
             }
         )
 
+    def _solve_characteristic_equation(self, matrix):
+        """
+        Small Jacobians (the common case in bifurcation sweeps) are solved in
+        closed form; larger ones go to the general eigensolver
+        """
+        eigenvalues = _small_eigenvalues(matrix)
+        if eigenvalues is None:
+            eigenvalues = self._general_eigenvalues(matrix)
+        return eigenvalues
+
 class BifurcationAnalyzer:
     """
     Analyzes bifurcations in feedback systems
@@ -113,30 +357,51 @@ class BifurcationAnalyzer:
     def analyze_bifurcations(self, system, parameter_range):
         """
         Studies qualitative changes in system behavior
+        The parameter grid is swept once and the resulting spectra are shared
+        by bifurcation detection and stability-change analysis
         """
+        sweep = self._spectrum_sweep(system, parameter_range)
         return BifurcationAnalysis(
-            bifurcation_points=self.find_bifurcation_points(system, parameter_range),
-            stability_changes=self.analyze_stability_changes(system, parameter_range),
+            bifurcation_points=self.find_bifurcation_points(system, parameter_range, sweep),
+            stability_changes=self.analyze_stability_changes(system, sweep),
             parameter_sensitivity=self.analyze_parameter_sensitivity(system),
             behavioral_changes=self.analyze_behavioral_changes(system)
         )
 
-    def find_bifurcation_points(self, system, range_):
+    def find_bifurcation_points(self, system, range_, sweep=None):
         """
         Identifies critical parameter values where behavior changes
+        The whole parameter grid is decomposed in one sweep; every detector
+        reads the same stack of spectra instead of re-sweeping the range
         """
+        parameters, spectra = sweep or self._spectrum_sweep(system, range_)
+        real_crossings, complex_crossings = _eigenvalue_crossings(parameters, spectra)
         return BifurcationPoints(
-            saddle_node=self._find_saddle_node_bifurcations(system, range_),
-            hopf=self._find_hopf_bifurcations(system, range_),
+            saddle_node=self._find_saddle_node_bifurcations(system, real_crossings),
+            hopf=complex_crossings,
             period_doubling=self._find_period_doubling(system, range_),
-            transcritical=self._find_transcritical(system, range_),
+            transcritical=self._find_transcritical(system, real_crossings),
             metrics={
-                'parameter_values': self._compute_critical_values(system),
-                'stability_changes': self._analyze_stability_transitions(system),
+                'parameter_values': sorted(real_crossings + complex_crossings),
+                'stability_changes': self._analyze_stability_transitions(parameters, spectra),
                 'normal_forms': self._compute_normal_forms(system)
             }
         )
 
+    def _spectrum_sweep(self, system, range_):
+        """
+        One Jacobian eigendecomposition per grid parameter
+        Small Jacobians take the closed-form path, so a sweep over a planar
+        system never reaches the general eigensolver
+        """
+        parameters = list(range_)
+        spectra = []
+        for parameter in parameters:
+            jacobian = self._parameter_jacobian(system, parameter)
+            eigenvalues = _small_eigenvalues(jacobian)
+            spectra.append(self._compute_eigenvalues(jacobian) if eigenvalues is None else eigenvalues)
+        return parameters, spectra
+
 class PhaseAnalyzer:
     """
     Analyzes phase space characteristics
@@ -155,15 +420,24 @@ class PhaseAnalyzer:
     def compute_trajectories(self, system):
         """
         Computes system trajectories in phase space
+        All initial conditions are integrated in one batch, and every
+        trajectory metric is derived from those solutions
         """
+        solutions = self._solve_differential_equations(system)
         return TrajectoryAnalysis(
-            solutions=self._solve_differential_equations(system),
-            stability_types=self._classify_trajectory_stability(system),
-            convergence_rates=self._compute_convergence_rates(system),
-            periodic_orbits=self._find_periodic_orbits(system),
+            solutions=solutions,
+            stability_types=self._classify_trajectory_stability(solutions),
+            convergence_rates=self._compute_convergence_rates(solutions),
+            periodic_orbits=self._find_periodic_orbits(solutions),
             metrics={
-                'lyapunov_exponents': self._compute_lyapunov_exponents(system),
-                'poincare_sections': self._compute_poincare_sections(system),
-                'orbital_stability': self._assess_orbital_stability(system)
+                'lyapunov_exponents': self._compute_lyapunov_exponents(system, solutions),
+                'poincare_sections': self._compute_poincare_sections(solutions),
+                'orbital_stability': self._assess_orbital_stability(solutions)
             }
         )
+
+    def _solve_differential_equations(self, system):
+        """
+        Integrates every initial condition of the system over its time grid
+        """
+        return _rk4_batch(system['rhs'], system['initial_conditions'], system['times'])
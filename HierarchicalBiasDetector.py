@@ -1,15 +1,131 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
+from typing import Any
+
+def _decayed_cumulative(series, decay):
+    """
+    Running exponentially-decayed sum: c[t] = decay * c[t-1] + x[t]
+    """
+    return list(accumulate(series, lambda total, value: total * decay + value))
+
+def _indicator_bitsets(records, indicators):
+    """
+    Packs per-record boolean indicators into one int bitset per indicator
+    (bit i set when record i carries the indicator), in a single pass over records
+    Patterns are then combined with &, |, ^, ~ and counted with int.bit_count()
+    """
+    digits = {name: [] for name in indicators}
+    for record in reversed(records):
+        for name, column in digits.items():
+            column.append('1' if record.get(name) else '0')
+    return {name: int(''.join(column) or '0', 2) for name, column in digits.items()}
+
+@dataclass(slots=True, frozen=True)
+class PowerAnalysis:
+    """Result of PowerDynamicsAnalyzer.analyze_power_dynamics"""
+    power_distribution: Any
+    decision_influence: Any
+    resource_control: Any
+    authority_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class PowerDistribution:
+    """Result of PowerDynamicsAnalyzer.analyze_power_distribution"""
+    formal_power: Any
+    informal_power: Any
+    resource_power: Any
+    social_capital: Any
+
+@dataclass(slots=True, frozen=True)
+class BiasPatterns:
+    """Result of BiasPatternDetector.detect_bias_patterns"""
+    structural_bias: Any
+    procedural_bias: Any
+    distributional_bias: Any
+    representational_bias: Any
+
+@dataclass(slots=True, frozen=True)
+class StructuralBias:
+    """Result of BiasPatternDetector.detect_structural_patterns"""
+    institutional_barriers: Any
+    systemic_exclusion: Any
+    privilege_patterns: Any
+    access_inequities: Any
+
+@dataclass(slots=True, frozen=True)
+class EquityAnalysis:
+    """Result of EquityAnalyzer.analyze_equity"""
+    outcome_equity: Any
+    opportunity_equity: Any
+    resource_equity: Any
+    participation_equity: Any
+
+@dataclass(slots=True, frozen=True)
+class OutcomeDistribution:
+    """Result of EquityAnalyzer.analyze_outcome_distribution"""
+    benefit_distribution: Any
+    burden_distribution: Any
+    risk_distribution: Any
+    opportunity_distribution: Any
+
+@dataclass(slots=True, frozen=True)
+class ImpactAssessment:
+    """Result of ImpactAssessor.assess_impacts"""
+    direct_impacts: Any
+    indirect_impacts: Any
+    cumulative_impacts: Any
+    intergenerational_impacts: Any
+
+@dataclass(slots=True, frozen=True)
+class DirectEffects:
+    """Result of ImpactAssessor.assess_direct_effects"""
+    economic_impact: Any
+    social_impact: Any
+    psychological_impact: Any
+    health_impact: Any
+
+@dataclass(slots=True, frozen=True)
+class InterventionPlan:
+    """Result of InterventionPlanner.plan_interventions"""
+    structural_changes: Any
+    policy_reforms: Any
+    process_improvements: Any
+    monitoring_systems: Any
+
+@dataclass(slots=True, frozen=True)
+class StructuralInterventions:
+    """Result of InterventionPlanner.plan_structural_interventions"""
+    power_redistribution: Any
+    access_improvement: Any
+    representation_enhancement: Any
+    accountability_measures: Any
+
 class HierarchicalBiasDetector:
     """
     System for detecting and analyzing hierarchical biases in decisions and processes
     """
-    def __init__(self):
-        self.power_analyzer = PowerDynamicsAnalyzer()
-        self.bias_detector = BiasPatternDetector()
-        self.equity_analyzer = EquityAnalyzer()
-        self.impact_assessor = ImpactAssessor()
-        self.intervention_planner = InterventionPlanner()
+    @cached_property
+    def power_analyzer(self):
+        return PowerDynamicsAnalyzer()
+
+    @cached_property
+    def bias_detector(self):
+        return BiasPatternDetector()
+
+    @cached_property
+    def equity_analyzer(self):
+        return EquityAnalyzer()
+
+    @cached_property
+    def impact_assessor(self):
+        return ImpactAssessor()
+
+    @cached_property
+    def intervention_planner(self):
+        return InterventionPlanner()
 
 class PowerDynamicsAnalyzer:
     """
@@ -38,6 +154,8 @@ class BiasPatternDetector:
     """
     Detects patterns of hierarchical bias in systems and decisions
     """
+    STRUCTURAL_INDICATORS = ('barrier', 'excluded', 'privileged', 'access_limited')
+
     def detect_bias_patterns(self, data):
         return BiasPatterns(
             structural_bias=self.detect_structural_patterns(data),
@@ -49,12 +167,15 @@ class BiasPatternDetector:
     def detect_structural_patterns(self, data):
         """
         Identifies systemic patterns of hierarchical bias
+        Record-level indicators are packed into bitsets once; the detectors
+        work on whole-population masks instead of branching per record
         """
+        flags = _indicator_bitsets(data['records'], self.STRUCTURAL_INDICATORS)
         return StructuralBias(
-            institutional_barriers=self.identify_barriers(data),
-            systemic_exclusion=self.identify_exclusion_patterns(data),
-            privilege_patterns=self.identify_privilege_systems(data),
-            access_inequities=self.identify_access_disparities(data)
+            institutional_barriers=self.identify_barriers(flags),
+            systemic_exclusion=self.identify_exclusion_patterns(flags),
+            privilege_patterns=self.identify_privilege_systems(flags),
+            access_inequities=self.identify_access_disparities(flags)
         )
 
 class EquityAnalyzer:
@@ -84,6 +205,9 @@ class ImpactAssessor:
     """
     Assesses impacts of hierarchical bias on different groups
     """
+    # Per-period carry-over of accumulated disadvantage
+    CUMULATIVE_DECAY = 0.9
+
     def assess_impacts(self, bias_data):
         return ImpactAssessment(
             direct_impacts=self.assess_direct_effects(bias_data),
@@ -103,6 +227,17 @@ class ImpactAssessor:
             health_impact=self.assess_health_effects(bias_data)
         )
 
+    def assess_cumulative_effects(self, bias_data):
+        """
+        Accumulates each group's per-period impact series with exponential decay
+        Groups are independent, so each is a single linear pass
+        """
+        decay = self.CUMULATIVE_DECAY
+        return {
+            group: _decayed_cumulative(series, decay)
+            for group, series in bias_data['group_series'].items()
+        }
+
 class InterventionPlanner:
     """
     Plans interventions to address identified hierarchical biases
@@ -1,16 +1,274 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+import hashlib
+import json
+import os
+import random
+import tempfile
+from array import array
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from operator import mul
+from statistics import fmean, pstdev
+from typing import Any
+
+@dataclass(slots=True, frozen=True)
+class ImpactAggregation:
+    """Result of ImpactAggregationSystem.aggregate"""
+    hierarchical_aggregation: Any
+    weighted_combination: Any
+    temporal_integration: Any
+    uncertainty_handling: Any
+    validation: Any
+
+@dataclass(slots=True, frozen=True)
+class HierarchicalAggregation:
+    """Result of HierarchicalAggregator.aggregate_hierarchically"""
+    level_aggregation: Any
+    cross_level_effects: Any
+    hierarchy_validation: Any
+    composite_scores: Any
+
+@dataclass(slots=True, frozen=True)
+class LevelAggregation:
+    """Result of HierarchicalAggregator.aggregate_by_level"""
+    primary_impacts: Any
+    secondary_impacts: Any
+    tertiary_impacts: Any
+    interaction_effects: Any
+    level_metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class WeightedCombination:
+    """Result of WeightedCombiner.combine_weighted_impacts"""
+    dimensional_weights: Any
+    contextual_weights: Any
+    stakeholder_weights: Any
+    temporal_weights: Any
+
+@dataclass(slots=True, frozen=True)
+class DimensionalWeights:
+    """Result of WeightedCombiner.calculate_dimension_weights"""
+    core_dimensions: Any
+    secondary_dimensions: Any
+    cross_dimensional: Any
+    adaptive_weights: Any
+    weight_metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class TemporalIntegration:
+    """Result of TemporalIntegrator.integrate_temporal_impacts"""
+    immediate_effects: Any
+    medium_term_effects: Any
+    long_term_effects: Any
+    cumulative_effects: Any
+
+@dataclass(slots=True, frozen=True)
+class ImmediateEffects:
+    """Result of TemporalIntegrator.integrate_immediate"""
+    direct_impacts: Any
+    short_term_dynamics: Any
+    response_patterns: Any
+    stabilization_effects: Any
+    temporal_metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class UncertaintyHandling:
+    """Result of UncertaintyHandler.handle_uncertainty"""
+    confidence_intervals: Any
+    sensitivity_analysis: Any
+    robustness_checks: Any
+    uncertainty_propagation: Any
+
+@dataclass(slots=True, frozen=True)
+class ConfidenceAnalysis:
+    """Result of UncertaintyHandler.calculate_confidence"""
+    statistical_confidence: Any
+    methodological_confidence: Any
+    data_quality_confidence: Any
+    aggregation_confidence: Any
+    confidence_metrics: Any
+
+@dataclass(slots=True, frozen=True)
+class ValidationResults:
+    """Result of ValidationEngine.validate_aggregation"""
+    internal_validation: Any
+    external_validation: Any
+    consistency_checks: Any
+    plausibility_analysis: Any
+
+@dataclass(slots=True, frozen=True)
+class InternalValidation:
+    """Result of ValidationEngine.perform_internal_validation"""
+    logic_checks: Any
+    consistency_analysis: Any
+    coherence_assessment: Any
+    reliability_tests: Any
+    validation_metrics: Any
+
+# Bump when a pipeline result changes shape; the module source is hashed into the key too
+_CACHE_FORMAT = 1
+# Directory for the opt-in disk cache when none is passed to ImpactAggregationSystem
+CACHE_DIR_ENV = 'KYOSAN_IMPACT_CACHE_DIR'
+
+# Result dataclasses the disk cache may rebuild, by name
+_RESULT_TYPES = {cls.__name__: cls for cls in (
+    ImpactAggregation, HierarchicalAggregation, LevelAggregation, WeightedCombination,
+    DimensionalWeights, TemporalIntegration, ImmediateEffects, UncertaintyHandling,
+    ConfidenceAnalysis, ValidationResults, InternalValidation
+)}
+
+def _to_json(value):
+    """
+    Plain-JSON form of a pipeline value; result dataclasses and tuples are tagged
+    so _from_json rebuilds them. Raises TypeError for anything else
+    """
+    if _RESULT_TYPES.get(type(value).__name__) is type(value):
+        return {'__result__': type(value).__name__,
+                'fields': {f.name: _to_json(getattr(value, f.name)) for f in fields(value)}}
+    if isinstance(value, tuple):
+        return {'__tuple__': [_to_json(v) for v in value]}
+    if isinstance(value, list):
+        return [_to_json(v) for v in value]
+    if isinstance(value, dict):
+        if not all(type(k) is str for k in value) or '__result__' in value or '__tuple__' in value:
+            raise TypeError("dict keys must be untagged strings")
+        return {k: _to_json(v) for k, v in value.items()}
+    if value is None or type(value) in (bool, int, float, str):
+        return value
+    raise TypeError(f"{type(value).__name__} is not cacheable")
+
+def _from_json(obj):
+    """json.load object_hook undoing _to_json's tags"""
+    if '__result__' in obj:
+        return _RESULT_TYPES[obj['__result__']](**obj['fields'])
+    if '__tuple__' in obj:
+        return tuple(obj['__tuple__'])
+    return obj
+
+@lru_cache(maxsize=None)
+def _cache_salt():
+    """Format version plus a digest of this module, so any code change misses the cache"""
+    try:
+        with open(__file__, 'rb') as f:
+            source = f.read()
+    except OSError:
+        source = b''
+    return f"{_CACHE_FORMAT}:".encode() + hashlib.blake2b(source).digest()
+
 class ImpactAggregationSystem:
     """
     Advanced system for aggregating multiple types of impacts
     Implements sophisticated weighting and combination algorithms
     """
-    def __init__(self):
-        self.hierarchical_aggregator = HierarchicalAggregator()
-        self.weighted_combiner = WeightedCombiner()
-        self.temporal_integrator = TemporalIntegrator()
-        self.uncertainty_handler = UncertaintyHandler()
-        self.validation_engine = ValidationEngine()
+    MAX_CACHE_ENTRIES = 1024
+
+    def __init__(self, cache_dir=None, max_cache_entries=MAX_CACHE_ENTRIES):
+        """
+        Results are cached on disk only when cache_dir (or $KYOSAN_IMPACT_CACHE_DIR)
+        is set; the least recently used entries beyond max_cache_entries are pruned
+        """
+        self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or None
+        self.max_cache_entries = max_cache_entries
+
+    @cached_property
+    def hierarchical_aggregator(self):
+        return HierarchicalAggregator()
+
+    @cached_property
+    def weighted_combiner(self):
+        return WeightedCombiner()
+
+    @cached_property
+    def temporal_integrator(self):
+        return TemporalIntegrator()
+
+    @cached_property
+    def uncertainty_handler(self):
+        return UncertaintyHandler()
+
+    @cached_property
+    def validation_engine(self):
+        return ValidationEngine()
+
+    def aggregate(self, impact_data):
+        """
+        Runs the full aggregation pipeline, memoized on disk by a content hash of impact_data
+        when a cache directory is configured. Identical inputs are read back instead
+        of re-running all five stages.
+        impact_data also carries the per-dimension 'values' and 'uncertainties'
+        read by the uncertainty stage. Inputs or results that aren't plain JSON
+        (sets, arrays, non-string keys, ...) are computed without the cache
+        """
+        if self.cache_dir is None:
+            return self._run_pipeline(impact_data)
+        try:
+            payload = json.dumps(_to_json(impact_data), sort_keys=True, separators=(',', ':'))
+        except TypeError:
+            return self._run_pipeline(impact_data)
+        key = hashlib.blake2b(_cache_salt() + payload.encode()).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                result = json.load(f, object_hook=_from_json)
+            # Refresh the mtime, which orders entries for pruning
+            os.utime(cache_path)
+            return result
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError):
+            # Truncated or foreign file: recompute and overwrite it
+            pass
+
+        result = self._run_pipeline(impact_data)
+        try:
+            document = json.dumps(_to_json(result))
+        except TypeError:
+            return result
+
+        # Written to a temp file and renamed, so readers never see a partial entry
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(document)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._prune_cache()
+        return result
+
+    def _prune_cache(self):
+        """Removes the least recently used entries beyond max_cache_entries"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except FileNotFoundError:
+                        pass
+        excess = len(entries) - self.max_cache_entries
+        if excess > 0:
+            for _, path in sorted(entries)[:excess]:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    def _run_pipeline(self, impact_data):
+        hierarchical = self.hierarchical_aggregator.aggregate_hierarchically(impact_data)
+        return ImpactAggregation(
+            hierarchical_aggregation=hierarchical,
+            weighted_combination=self.weighted_combiner.combine_weighted_impacts(impact_data),
+            temporal_integration=self.temporal_integrator.integrate_temporal_impacts(impact_data),
+            uncertainty_handling=self.uncertainty_handler.handle_uncertainty(impact_data),
+            validation=self.validation_engine.validate_aggregation(hierarchical)
+        )
 
 class HierarchicalAggregator:
     """
@@ -41,6 +299,43 @@ class HierarchicalAggregator:
             }
         )
 
+def _temporal_accumulators(series, decays):
+    """
+    One pass over series: an exponential moving level per horizon
+    (level = decay * level + (1 - decay) * x), plus total, peak and count
+    series must be a sequence; an empty one gives zero levels, total and peak
+    """
+    levels = dict.fromkeys(decays, 0.0)
+    horizons = list(decays.items())
+    for value in series:
+        for name, decay in horizons:
+            levels[name] = decay * levels[name] + (1 - decay) * value
+    return {'levels': levels, 'total': sum(series, 0.0), 'peak': max(series, default=0.0), 'count': len(series)}
+
+@dataclass
+class DimensionBatch:
+    """
+    Column-wise (struct-of-arrays) view of impact records
+    Built in a single pass so each record is read once, not once per weighting
+    Columns are stored as packed float32; items read back as Python floats,
+    so every reduction over them still accumulates in double precision
+    """
+    core_score: array = field(default_factory=lambda: array('f'))
+    secondary_score: array = field(default_factory=lambda: array('f'))
+    importance: array = field(default_factory=lambda: array('f'))
+    relevance: array = field(default_factory=lambda: array('f'))
+    priority: array = field(default_factory=lambda: array('f'))
+    balance: array = field(default_factory=lambda: array('f'))
+
+    @classmethod
+    def from_impacts(cls, impacts):
+        batch = cls()
+        columns = [(f.name, getattr(batch, f.name)) for f in fields(batch)]
+        for impact in impacts:
+            for name, column in columns:
+                column.append(impact.get(name, 0.0))
+        return batch
+
 class WeightedCombiner:
     """
     Combines impacts using sophisticated weighting schemes
@@ -56,17 +351,20 @@ class WeightedCombiner:
     def calculate_dimension_weights(self, impacts):
         """
         Calculates weights for different impact dimensions
+        The impact records are transposed into columns once and every weighting
+        reads only the columns it needs
         """
+        batch = DimensionBatch.from_impacts(impacts)
         return DimensionalWeights(
-            core_dimensions=self.weigh_core_dimensions(impacts),
-            secondary_dimensions=self.weigh_secondary_dimensions(impacts),
-            cross_dimensional=self.calculate_cross_weights(impacts),
-            adaptive_weights=self.calculate_adaptive_weights(impacts),
+            core_dimensions=self.weigh_core_dimensions(batch.core_score),
+            secondary_dimensions=self.weigh_secondary_dimensions(batch.secondary_score),
+            cross_dimensional=self.calculate_cross_weights(batch),
+            adaptive_weights=self.calculate_adaptive_weights(batch),
             weight_metrics={
-                'importance_factors': self.calculate_importance(impacts),
-                'relevance_scores': self.calculate_relevance(impacts),
-                'priority_indices': self.calculate_priorities(impacts),
-                'balance_factors': self.calculate_balance(impacts)
+                'importance_factors': self.calculate_importance(batch.importance),
+                'relevance_scores': self.calculate_relevance(batch.relevance),
+                'priority_indices': self.calculate_priorities(batch.priority),
+                'balance_factors': self.calculate_balance(batch.balance)
             }
         )
 
@@ -74,15 +372,28 @@ class TemporalIntegrator:
     """
     Integrates impacts across different time scales
     """
+    # Per-sample decay of each horizon's moving level, i.e. half-lives of 1, ~6.6
+    # and ~69 samples. These are tuning defaults, not derived from data: set them
+    # from the deployment's sampling interval and horizon lengths
+    HORIZON_DECAYS = {'immediate': 0.5, 'medium': 0.9, 'long': 0.99}
+
     def integrate_temporal_impacts(self, impact_series):
+        """
+        The per-horizon levels and cumulative totals come from one pass over
+        the series rather than one full pass per time scale
+        Any iterable is accepted; it is materialized once up front, since the
+        immediate-effects stage reads the series again
+        """
+        impact_series = list(impact_series)
+        accumulators = _temporal_accumulators(impact_series, self.HORIZON_DECAYS)
         return TemporalIntegration(
-            immediate_effects=self.integrate_immediate(impact_series),
-            medium_term_effects=self.integrate_medium_term(impact_series),
-            long_term_effects=self.integrate_long_term(impact_series),
-            cumulative_effects=self.calculate_cumulative(impact_series)
+            immediate_effects=self.integrate_immediate(impact_series, accumulators),
+            medium_term_effects=self.integrate_medium_term(accumulators),
+            long_term_effects=self.integrate_long_term(accumulators),
+            cumulative_effects=self.calculate_cumulative(accumulators)
         )
 
-    def integrate_immediate(self, series):
+    def integrate_immediate(self, series, accumulators):
         """
         Integrates immediate impact effects
         """
@@ -93,7 +404,7 @@ class TemporalIntegrator:
             stabilization_effects=self.analyze_stabilization(series),
             temporal_metrics={
                 'response_time': self.measure_response_time(series),
-                'peak_effects': self.measure_peak_effects(series),
+                'peak_effects': accumulators['peak'],
                 'decay_rates': self.calculate_decay_rates(series),
                 'integration_quality': self.assess_integration(series)
             }
@@ -102,14 +413,55 @@ class TemporalIntegrator:
 class UncertaintyHandler:
     """
     Handles uncertainty in impact aggregation
+    Monte Carlo draws go into one float32 buffer owned by the handler, which is
+    refilled in place and shared by the sensitivity and propagation stages
     """
+    N_SAMPLES = 1024
+
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+        self._noise = array('f')
+
     def handle_uncertainty(self, aggregated_impacts):
+        noise = self._draw_noise(len(aggregated_impacts['values']))
         return UncertaintyHandling(
             confidence_intervals=self.calculate_confidence(aggregated_impacts),
-            sensitivity_analysis=self.perform_sensitivity(aggregated_impacts),
+            sensitivity_analysis=self.perform_sensitivity(aggregated_impacts, noise),
             robustness_checks=self.check_robustness(aggregated_impacts),
-            uncertainty_propagation=self.analyze_propagation(aggregated_impacts)
+            uncertainty_propagation=self.analyze_propagation(aggregated_impacts, noise)
+        )
+
+    def _draw_noise(self, dimensions):
+        """
+        N_SAMPLES x dimensions standard normals, row-major, written into the
+        reused buffer (reallocated only when the dimension count changes)
+        """
+        size = self.N_SAMPLES * dimensions
+        if len(self._noise) != size:
+            self._noise = array('f', bytes(4 * size))
+        noise, gauss = self._noise, self._rng.gauss
+        for i in range(size):
+            noise[i] = gauss(0.0, 1.0)
+        return memoryview(noise)
+
+    def analyze_propagation(self, impacts, noise):
+        """
+        Propagates per-dimension uncertainty into the aggregate score:
+        sample_k = Σ values + Σ_d σ_d · z_kd
+        """
+        values, sigmas = impacts['values'], impacts['uncertainties']
+        dimensions = len(values)
+        base = sum(values)
+        samples = sorted(
+            base + sum(map(mul, sigmas, noise[k * dimensions:(k + 1) * dimensions]))
+            for k in range(self.N_SAMPLES)
         )
+        return {
+            'mean': fmean(samples),
+            'std': pstdev(samples),
+            'interval_95': (samples[int(0.025 * self.N_SAMPLES)],
+                            samples[int(0.975 * self.N_SAMPLES) - 1])
+        }
 
     def calculate_confidence(self, impacts):
         """
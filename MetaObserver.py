@@ -1,21 +1,137 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+def _snapshot_key(state):
+    """
+    (state['id'], state['version']) when the state carries both, else None
+    Callers that supply them promise a given pair always names the same content,
+    bumping 'version' on every change; states without them are never cached
+    """
+    try:
+        key = (state['id'], state['version'])
+        hash(key)
+    except (KeyError, TypeError):
+        return None
+    return key
+
+@dataclass(slots=True)
+class AwarenessState:
+    """Result of AwarenessTracker.track_awareness"""
+    primary_awareness: Any
+    meta_awareness: Any
+    recursive_awareness: Any
+    integration_state: Any
+
+@dataclass(slots=True)
+class RecursiveState:
+    """Result of AwarenessTracker.track_recursive_levels"""
+    level_depth: Any
+    awareness_boundaries: Any
+    integration_points: Any
+    termination_conditions: Any
+
+@dataclass(slots=True)
+class ObservationQuality:
+    """Result of ObservationMonitor.monitor_observation"""
+    objectivity_measure: Any
+    clarity_assessment: Any
+    completion_check: Any
+    bias_detection: Any
+
+@dataclass(slots=True, frozen=True)
+class ObjectivityMetrics:
+    """Result of ObservationMonitor.measure_objectivity"""
+    separation_degree: Any
+    attachment_level: Any
+    projection_index: Any
+    neutrality_score: Any
+
+@dataclass(slots=True)
+class MetaBiasAnalysis:
+    """Result of MetaBiasDetector.detect_meta_bias"""
+    observer_bias: Any
+    process_bias: Any
+    interpretation_bias: Any
+    systemic_bias: Any
+
+@dataclass(slots=True)
+class ObserverBias:
+    """Result of MetaBiasDetector.analyze_observer_bias"""
+    cognitive_bias: Any
+    emotional_bias: Any
+    perspective_bias: Any
+    historical_bias: Any
+
+@dataclass(slots=True)
+class PatternAnalysis:
+    """Result of PatternAnalyzer.analyze_patterns"""
+    observation_patterns: Any
+    meta_patterns: Any
+    recursive_patterns: Any
+    integration_patterns: Any
+
+@dataclass(slots=True)
+class MetaPatterns:
+    """Result of PatternAnalyzer.identify_meta_patterns"""
+    awareness_patterns: Any
+    observation_cycles: Any
+    bias_patterns: Any
+    integration_patterns: Any
+
+@dataclass(slots=True)
+class InsightCollection:
+    """Result of InsightGenerator.generate_insights"""
+    pattern_insights: Any
+    process_insights: Any
+    bias_insights: Any
+    improvement_insights: Any
+
+@dataclass(slots=True)
+class PatternInsights:
+    """Result of InsightGenerator.extract_pattern_insights"""
+    recurring_themes: Any
+    significant_correlations: Any
+    emergent_properties: Any
+    system_dynamics: Any
+
 class MetaObserver:
     """
     Implements recursive awareness of the observation process
     Maintains objectivity while observing the observer
     """
-    def __init__(self):
-        self.awareness_tracker = AwarenessTracker()
-        self.observation_monitor = ObservationMonitor()
-        self.bias_detector = MetaBiasDetector()
-        self.pattern_analyzer = PatternAnalyzer()
-        self.insight_generator = InsightGenerator()
+    @cached_property
+    def awareness_tracker(self):
+        return AwarenessTracker()
+
+    @cached_property
+    def observation_monitor(self):
+        return ObservationMonitor()
+
+    @cached_property
+    def bias_detector(self):
+        return MetaBiasDetector()
+
+    @cached_property
+    def pattern_analyzer(self):
+        return PatternAnalyzer()
+
+    @cached_property
+    def insight_generator(self):
+        return InsightGenerator()
 
 class AwarenessTracker:
     """
     Tracks levels of awareness and metacognition
     """
+    MEMO_MIN_DEPTH = 3  # only stacks deeper than two levels are worth caching
+    MAX_CACHED_LEVELS = 4096
+
+    def __init__(self):
+        self._level_cache = {}
+
     def track_awareness(self, observation_state):
         return AwarenessState(
             primary_awareness=self.track_primary_level(observation_state),
@@ -27,18 +143,54 @@ class AwarenessTracker:
     def track_recursive_levels(self, state):
         """
         Manages recursive levels of awareness without infinite regress
+        Levels are walked iteratively up to the computed depth; for deep stacks
+        each level's analysis is memoized per (state id, version, level); states
+        without an id and version are walked uncached
         """
+        depth = self.calculate_depth(state)
+        state_key = _snapshot_key(state) if depth >= self.MEMO_MIN_DEPTH else None
+        boundaries, integration_points, terminations = [], [], []
+        for level in range(depth):
+            if state_key is None:
+                analysis = self._analyze_level(state, level)
+            else:
+                analysis = self._level_cache.get((state_key, level))
+                if analysis is None:
+                    if len(self._level_cache) >= self.MAX_CACHED_LEVELS:
+                        self._level_cache.clear()
+                    analysis = self._level_cache[(state_key, level)] = self._analyze_level(state, level)
+            boundary, integration_point, termination = analysis
+            boundaries.append(boundary)
+            integration_points.append(integration_point)
+            terminations.append(termination)
         return RecursiveState(
-            level_depth=self.calculate_depth(state),
-            awareness_boundaries=self.define_boundaries(state),
-            integration_points=self.identify_integration(state),
-            termination_conditions=self.define_termination(state)
+            level_depth=depth,
+            awareness_boundaries=boundaries,
+            integration_points=integration_points,
+            termination_conditions=terminations
+        )
+
+    def _analyze_level(self, state, level):
+        """
+        (boundary, integration point, termination condition) of one awareness level
+        """
+        return (
+            self.define_boundaries(state, level),
+            self.identify_integration(state, level),
+            self.define_termination(state, level)
         )
 
 class ObservationMonitor:
     """
     Monitors the quality and nature of observations
     """
+    MAX_SELECTIVE_ENTRIES = 4096
+
+    def __init__(self):
+        # Selective memoization: a process is cached only once it has been seen twice
+        self._seen = set()
+        self._selcache = {}
+
     def monitor_observation(self, observation_process):
         return ObservationQuality(
             objectivity_measure=self.measure_objectivity(observation_process),
@@ -50,13 +202,30 @@ class ObservationMonitor:
     def measure_objectivity(self, process):
         """
         Measures the objectivity of the observation process
+        Processes that recur (same id and version) are served from the selective
+        cache; one-off processes only leave their key behind
         """
-        return ObjectivityMetrics(
+        key = _snapshot_key(process)
+        metrics = self._selcache.get(key)
+        if metrics is not None:
+            return metrics
+        metrics = ObjectivityMetrics(
             separation_degree=self.measure_separation(process),
             attachment_level=self.measure_attachment(process),
             projection_index=self.measure_projection(process),
             neutrality_score=self.measure_neutrality(process)
         )
+        if key is None:
+            return metrics
+        if key in self._seen:
+            if len(self._selcache) >= self.MAX_SELECTIVE_ENTRIES:
+                self._selcache.clear()
+            self._selcache[key] = metrics
+        else:
+            if len(self._seen) >= self.MAX_SELECTIVE_ENTRIES:
+                self._seen.clear()
+            self._seen.add(key)
+        return metrics
 
 class MetaBiasDetector:
     """
@@ -85,14 +254,19 @@ class PatternAnalyzer:
     """
     Analyzes patterns in the observation process
     """
-    def analyze_patterns(self, observation_history):
-        return PatternAnalysis(
-            observation_patterns=self.identify_patterns(observation_history),
-            meta_patterns=self.identify_meta_patterns(observation_history),
-            recursive_patterns=self.identify_recursive_patterns(observation_history),
-            integration_patterns=self.identify_integration_patterns(observation_history)
+    @cached_property
+    def _pattern_fns(self):
+        """Pattern identifiers bound once, in PatternAnalysis field order"""
+        return (
+            self.identify_patterns,
+            self.identify_meta_patterns,
+            self.identify_recursive_patterns,
+            self.identify_integration_patterns
         )
 
+    def analyze_patterns(self, observation_history):
+        return PatternAnalysis(*[identify(observation_history) for identify in self._pattern_fns])
+
     def identify_meta_patterns(self, history):
         """
         Identifies patterns in meta-level observation
@@ -108,14 +282,19 @@ class InsightGenerator:
     """
     Generates insights from meta-observation
     """
-    def generate_insights(self, meta_data):
-        return InsightCollection(
-            pattern_insights=self.extract_pattern_insights(meta_data),
-            process_insights=self.extract_process_insights(meta_data),
-            bias_insights=self.extract_bias_insights(meta_data),
-            improvement_insights=self.extract_improvement_insights(meta_data)
+    @cached_property
+    def _insight_fns(self):
+        """Insight extractors bound once, in InsightCollection field order"""
+        return (
+            self.extract_pattern_insights,
+            self.extract_process_insights,
+            self.extract_bias_insights,
+            self.extract_improvement_insights
         )
 
+    def generate_insights(self, meta_data):
+        return InsightCollection(*[extract(meta_data) for extract in self._insight_fns])
+
     def extract_pattern_insights(self, data):
         """
         Extracts insights from observed patterns
@@ -1,28 +1,134 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from functools import cached_property
+from operator import mul, sub
+from typing import Any, NamedTuple
+
+_WELLBEING_COMPONENTS = ('emotional_balance', 'cognitive_function', 'social_connection', 'purpose')
+_WELLBEING_WEIGHTS = (0.3, 0.25, 0.25, 0.2)
+_CONNECTIVITY_WEIGHTS = (0.3, 0.3, 0.4)  # size, frequency, strength
+_DUNBAR_NUMBER = 150
+# Saturating network-size score min(1, n / 150) for integer n < 1024; larger n clamp to the last entry
+_NETWORK_SIZE_LUT = tuple(min(1.0, n / _DUNBAR_NUMBER) for n in range(1024))
+_DAILY_INTERACTIONS_PER_WEEK = 7.0
+
+class HealthResult(NamedTuple):
+    """Health metrics for one record; _asdict() gives the former dict form"""
+    qaly: Any
+    daly: Any
+    mortality_rate: Any
+    morbidity_index: Any
+
+class WellbeingResult(NamedTuple):
+    """Wellbeing metrics for one record; _asdict() gives the former dict form"""
+    life_satisfaction: Any
+    psychological_wellbeing: Any
+    stress_index: Any
+    resilience_score: Any
+
+class SocialResult(NamedTuple):
+    """Social metrics for one record; _asdict() gives the former dict form"""
+    social_connectivity: Any
+    support_network: Any
+    community_integration: Any
+    relationship_quality: Any
+
+class EconomicResult(NamedTuple):
+    """Economic metrics for one record; _asdict() gives the former dict form"""
+    resource_access: Any
+    financial_stability: Any
+    economic_mobility: Any
+    opportunity_index: Any
+
+class ImpactResult(NamedTuple):
+    """Impact metrics for one record; _asdict() gives the former dict form"""
+    direct_impact: Any
+    indirect_impact: Any
+    cumulative_impact: Any
+    sustainability_score: Any
+
+def _weighted_rows(columns, weights):
+    """
+    Per-row weighted sums over columnar data: columns[j][i] is component j of
+    row i, so N records are scored without building a dict per record
+    """
+    return [sum(map(mul, row, weights)) for row in zip(*columns)]
+
+def _summarize_connections(connections):
+    """
+    Network size, mean interaction frequency and mean relationship strength
+    in a single pass, so connections may be any iterable (even a generator)
+    """
+    count = 0
+    frequency_total = strength_total = 0.0
+    for connection in connections:
+        count += 1
+        frequency_total += connection['frequency']
+        strength_total += connection['strength']
+    denominator = max(count, 1)
+    return count, frequency_total / denominator, strength_total / denominator
+
+def _decayed_sums(direct, indirect, decay):
+    """
+    Σ decay^i · direct[i] and Σ decay^i · indirect[i] in one fused pass
+    The weight is carried as a running product, so no power is evaluated
+    """
+    total_direct = total_indirect = 0.0
+    weight = 1.0
+    for d, i in zip(direct, indirect):
+        total_direct += weight * d
+        total_indirect += weight * i
+        weight *= decay
+    return total_direct, total_indirect
+
 class MetricsCalculationSystem:
     """
     Comprehensive system for calculating various types of metrics
     Implements specific mathematical formulations and statistical methods
     """
-    def __init__(self):
-        self.health_metrics = HealthMetricsCalculator()
-        self.wellbeing_metrics = WellbeingMetricsCalculator()
-        self.social_metrics = SocialMetricsCalculator()
-        self.economic_metrics = EconomicMetricsCalculator()
-        self.impact_metrics = ImpactMetricsCalculator()
+    def calculate_all(self, data):
+        """
+        Every metric family for one record
+        """
+        return {
+            'health': self.health_metrics.calculate_health_metrics(data),
+            'wellbeing': self.wellbeing_metrics.calculate_wellbeing_metrics(data),
+            'social': self.social_metrics.calculate_social_metrics(data),
+            'economic': self.economic_metrics.calculate_economic_metrics(data),
+            'impact': self.impact_metrics.calculate_impact_metrics(data)
+        }
+
+    @cached_property
+    def health_metrics(self):
+        return HealthMetricsCalculator()
+
+    @cached_property
+    def wellbeing_metrics(self):
+        return WellbeingMetricsCalculator()
+
+    @cached_property
+    def social_metrics(self):
+        return SocialMetricsCalculator()
+
+    @cached_property
+    def economic_metrics(self):
+        return EconomicMetricsCalculator()
+
+    @cached_property
+    def impact_metrics(self):
+        return ImpactMetricsCalculator()
 
 class HealthMetricsCalculator:
     """
     Calculates health-related metrics using specific formulas
     """
     def calculate_health_metrics(self, data):
-        return {
-            'qaly': self.calculate_qaly(data),
-            'daly': self.calculate_daly(data),
-            'mortality_rate': self.calculate_mortality_rate(data),
-            'morbidity_index': self.calculate_morbidity_index(data)
-        }
+        return HealthResult(
+            qaly=self.calculate_qaly(data),
+            daly=self.calculate_daly(data),
+            mortality_rate=self.calculate_mortality_rate(data),
+            morbidity_index=self.calculate_morbidity_index(data)
+        )
 
     def calculate_qaly(self, data):
         """
@@ -40,17 +146,35 @@ class HealthMetricsCalculator:
         
         return {'value': qaly, 'uncertainty': uncertainty}
 
+    def calculate_qaly_batch(self, columns):
+        """
+        QALYs for a cohort from 'life_expectancy', 'current_age', 'health_state'
+        and 'sample_size' columns, computed column-wise with map instead of
+        one calculate_qaly call (and its dicts) per person
+        """
+        life_years = map(sub, columns['life_expectancy'], columns['current_age'])
+        quality_weights = map(self._calculate_quality_weight, columns['health_state'])
+        qalys = list(map(mul, life_years, quality_weights))
+        sample_sizes = columns['sample_size']
+        return {
+            'value': qalys,
+            'uncertainty': {
+                'confidence_interval': list(map(self._calculate_ci, qalys, sample_sizes)),
+                'standard_error': list(map(self._calculate_se, qalys, sample_sizes))
+            }
+        }
+
 class WellbeingMetricsCalculator:
     """
     Calculates wellbeing-related metrics
     """
     def calculate_wellbeing_metrics(self, data):
-        return {
-            'life_satisfaction': self.calculate_life_satisfaction(data),
-            'psychological_wellbeing': self.calculate_psychological_wellbeing(data),
-            'stress_index': self.calculate_stress_index(data),
-            'resilience_score': self.calculate_resilience_score(data)
-        }
+        return WellbeingResult(
+            life_satisfaction=self.calculate_life_satisfaction(data),
+            psychological_wellbeing=self.calculate_psychological_wellbeing(data),
+            stress_index=self.calculate_stress_index(data),
+            resilience_score=self.calculate_resilience_score(data)
+        )
 
     def calculate_psychological_wellbeing(self, data):
         """
@@ -64,15 +188,8 @@ class WellbeingMetricsCalculator:
             'purpose': self._calculate_purpose_score(data)
         }
         
-        weights = {
-            'emotional_balance': 0.3,
-            'cognitive_function': 0.25,
-            'social_connection': 0.25,
-            'purpose': 0.2
-        }
-        
-        weighted_sum = sum(score * weights[metric] 
-                         for metric, score in components.items())
+        weighted_sum = sum(map(mul, (components[name] for name in _WELLBEING_COMPONENTS),
+                               _WELLBEING_WEIGHTS))
         
         reliability = self._calculate_reliability_coefficient(components)
         
@@ -82,26 +199,38 @@ class WellbeingMetricsCalculator:
             'reliability': reliability
         }
 
+    def calculate_psychological_wellbeing_batch(self, columns):
+        """
+        Psychological wellbeing for N people at once
+        columns maps each component name to a sequence of N scores; the result
+        holds one score column instead of N per-person dicts
+        """
+        return {
+            'score': _weighted_rows([columns[name] for name in _WELLBEING_COMPONENTS], _WELLBEING_WEIGHTS),
+            'components': columns,
+            'reliability': self._calculate_reliability_coefficient(columns)
+        }
+
 class SocialMetricsCalculator:
     """
     Calculates social-related metrics
     """
     def calculate_social_metrics(self, data):
-        return {
-            'social_connectivity': self.calculate_social_connectivity(data),
-            'support_network': self.calculate_support_network(data),
-            'community_integration': self.calculate_community_integration(data),
-            'relationship_quality': self.calculate_relationship_quality(data)
-        }
+        return SocialResult(
+            social_connectivity=self.calculate_social_connectivity(data),
+            support_network=self.calculate_support_network(data),
+            community_integration=self.calculate_community_integration(data),
+            relationship_quality=self.calculate_relationship_quality(data)
+        )
 
     def calculate_social_connectivity(self, data):
         """
         Calculates social connectivity index
         Considers network size, interaction frequency, and relationship strength
         """
-        network_size = len(data['social_connections'])
-        interaction_freq = self._calculate_mean_interaction_frequency(data)
-        relationship_strength = self._calculate_relationship_strength(data)
+        network_size, interaction_freq, relationship_strength = _summarize_connections(
+            data['social_connections']
+        )
         
         # Normalized scores (0-1)
         norm_size = self._normalize_network_size(network_size)
@@ -109,11 +238,11 @@ class SocialMetricsCalculator:
         norm_strength = relationship_strength  # Already normalized
         
         # Weighted combination
-        weights = {'size': 0.3, 'frequency': 0.3, 'strength': 0.4}
+        size_weight, frequency_weight, strength_weight = _CONNECTIVITY_WEIGHTS
         connectivity_score = (
-            norm_size * weights['size'] +
-            norm_freq * weights['frequency'] +
-            norm_strength * weights['strength']
+            norm_size * size_weight +
+            norm_freq * frequency_weight +
+            norm_strength * strength_weight
         )
         
         return {
@@ -125,17 +254,50 @@ class SocialMetricsCalculator:
             }
         }
 
+    def calculate_social_connectivity_batch(self, columns):
+        """
+        Social connectivity for N people from 'network_size',
+        'interaction_frequency' and 'relationship_strength' columns
+        """
+        normalized = (
+            list(map(self._normalize_network_size, columns['network_size'])),
+            list(map(self._normalize_frequency, columns['interaction_frequency'])),
+            columns['relationship_strength']  # Already normalized
+        )
+        return {
+            'overall_score': _weighted_rows(normalized, _CONNECTIVITY_WEIGHTS),
+            'components': columns
+        }
+
+    @staticmethod
+    def _normalize_network_size(network_size):
+        """
+        Network size relative to Dunbar's number, saturating at 1
+        Integer sizes are served from a precomputed table; other numbers use
+        the closed form
+        """
+        if type(network_size) is int:
+            return _NETWORK_SIZE_LUT[min(max(network_size, 0), 1023)]
+        return min(1.0, max(network_size, 0) / _DUNBAR_NUMBER)
+
+    @staticmethod
+    def _normalize_frequency(interaction_freq):
+        """
+        Weekly interaction frequency relative to daily contact, saturating at 1
+        """
+        return min(1.0, max(interaction_freq, 0.0) / _DAILY_INTERACTIONS_PER_WEEK)
+
 class EconomicMetricsCalculator:
     """
     Calculates economic-related metrics
     """
     def calculate_economic_metrics(self, data):
-        return {
-            'resource_access': self.calculate_resource_access(data),
-            'financial_stability': self.calculate_financial_stability(data),
-            'economic_mobility': self.calculate_economic_mobility(data),
-            'opportunity_index': self.calculate_opportunity_index(data)
-        }
+        return EconomicResult(
+            resource_access=self.calculate_resource_access(data),
+            financial_stability=self.calculate_financial_stability(data),
+            economic_mobility=self.calculate_economic_mobility(data),
+            opportunity_index=self.calculate_opportunity_index(data)
+        )
 
     def calculate_financial_stability(self, data):
         """
@@ -167,12 +329,12 @@ class ImpactMetricsCalculator:
     Calculates impact-related metrics
     """
     def calculate_impact_metrics(self, data):
-        return {
-            'direct_impact': self.calculate_direct_impact(data),
-            'indirect_impact': self.calculate_indirect_impact(data),
-            'cumulative_impact': self.calculate_cumulative_impact(data),
-            'sustainability_score': self.calculate_sustainability_score(data)
-        }
+        return ImpactResult(
+            direct_impact=self.calculate_direct_impact(data),
+            indirect_impact=self.calculate_indirect_impact(data),
+            cumulative_impact=self.calculate_cumulative_impact(data),
+            sustainability_score=self.calculate_sustainability_score(data)
+        )
 
     def calculate_cumulative_impact(self, data):
         """
@@ -180,20 +342,18 @@ class ImpactMetricsCalculator:
         Considers both direct and indirect effects with temporal weighting
         """
         time_periods = data['time_series']
-        direct_impacts = [self._calculate_period_direct_impact(period) 
-                        for period in time_periods]
-        indirect_impacts = [self._calculate_period_indirect_impact(period) 
-                          for period in time_periods]
+        direct_impacts, indirect_impacts = [], []
+        for period in time_periods:
+            direct_impacts.append(self._calculate_period_direct_impact(period))
+            indirect_impacts.append(self._calculate_period_indirect_impact(period))
         
         # Temporal decay factor
         decay_rate = 0.9  # Example decay rate
-        temporal_weights = [decay_rate ** i for i in range(len(time_periods))]
         
         # Weighted combination over time
-        cumulative_direct = sum(impact * weight 
-                              for impact, weight in zip(direct_impacts, temporal_weights))
-        cumulative_indirect = sum(impact * weight 
-                                for impact, weight in zip(indirect_impacts, temporal_weights))
+        cumulative_direct, cumulative_indirect = _decayed_sums(
+            direct_impacts, indirect_impacts, decay_rate
+        )
         
         return {
             'total_impact': cumulative_direct + cumulative_indirect,
@@ -1,20 +1,171 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+@dataclass(slots=True)
+class EthicalMetrics:
+    """Result of EthicalMetricsTracker.track_ethical_metrics"""
+    principle_metrics: Any
+    fairness_metrics: Any
+    transparency_metrics: Any
+    accountability_metrics: Any
+
+@dataclass(slots=True)
+class PrincipleMetrics:
+    """Result of EthicalMetricsTracker.track_principles"""
+    core_measurements: Any
+    tracking_parameters: Any
+
+@dataclass(slots=True)
+class PerformanceMetrics:
+    """Result of PerformanceMetricsTracker.track_performance_metrics"""
+    processing_metrics: Any
+    response_metrics: Any
+    accuracy_metrics: Any
+    efficiency_metrics: Any
+
+@dataclass(slots=True)
+class ProcessingMetrics:
+    """Result of PerformanceMetricsTracker.track_processing"""
+    runtime_metrics: Any
+    resource_metrics: Any
+
+@dataclass(slots=True)
+class ImpactMetrics:
+    """Result of ImpactMetricsTracker.track_impact_metrics"""
+    direct_impacts: Any
+    indirect_impacts: Any
+    cumulative_impacts: Any
+    long_term_impacts: Any
+
+@dataclass(slots=True)
+class DirectImpactMetrics:
+    """Result of ImpactMetricsTracker.track_direct_impacts"""
+    impact_categories: Any
+    tracking_parameters: Any
+
+@dataclass(slots=True)
+class LearningMetrics:
+    """Result of LearningMetricsTracker.track_learning_metrics"""
+    adaptation_metrics: Any
+    improvement_metrics: Any
+    stability_metrics: Any
+    effectiveness_metrics: Any
+
+@dataclass(slots=True)
+class AdaptationMetrics:
+    """Result of LearningMetricsTracker.track_adaptation"""
+    adaptation_measures: Any
+
+@dataclass(slots=True)
+class IntegrationMetrics:
+    """Result of IntegrationMetricsTracker.track_integration_metrics"""
+    coherence_metrics: Any
+    consistency_metrics: Any
+    compatibility_metrics: Any
+    synergy_metrics: Any
+
+class PrincipleStore:
+    """
+    Struct-of-arrays history of principle measurements
+    One packed column per principle, so a trend window is a contiguous slice
+    rather than a run of per-sample nested dicts. Samples are timestamped and
+    kept for window_seconds, capped at max_samples
+    """
+    PRINCIPLES = ('non_maleficence', 'beneficence', 'autonomy')
+    THRESHOLDS = (0.95, 0.90, 0.95)
+
+    def __init__(self, window_seconds, max_samples):
+        self.window_seconds = window_seconds
+        self.max_samples = max_samples
+        self.times = array('d')
+        self.scores = tuple(array('d') for _ in self.PRINCIPLES)
+        self.violations = tuple(array('l') for _ in self.PRINCIPLES)
+        self._index = {name: i for i, name in enumerate(self.PRINCIPLES)}
+
+    def append(self, scores, violations, now=None):
+        """Records one sample column at now (monotonic seconds by default)"""
+        self.times.append(time.monotonic() if now is None else now)
+        for column, value in zip(self.scores, scores):
+            column.append(value)
+        for column, value in zip(self.violations, violations):
+            column.append(value)
+        # Trim in bulk once stale samples make up half the history, so
+        # trimming stays amortized O(1)
+        start = self._window_start()
+        if 2 * start >= len(self.times):
+            for column in (self.times,) + self.scores + self.violations:
+                del column[:start]
+
+    def _window_start(self):
+        """Index of the oldest sample inside the window ending at the newest one"""
+        times = self.times
+        if not times:
+            return 0
+        return max(bisect_left(times, times[-1] - self.window_seconds), len(times) - self.max_samples)
+
+    def view(self, principle):
+        """Read-only score history for one principle over the current window"""
+        column = self.scores[self._index[principle]]
+        return memoryview(column).toreadonly()[self._window_start():]
+
+    def threshold(self, principle):
+        return self.THRESHOLDS[self._index[principle]]
+
 class MetricsTrackingSystem:
     """
     Comprehensive system for tracking and analyzing ethical metrics
     """
-    def __init__(self):
-        self.ethical_metrics = EthicalMetricsTracker()
-        self.performance_metrics = PerformanceMetricsTracker()
-        self.impact_metrics = ImpactMetricsTracker()
-        self.learning_metrics = LearningMetricsTracker()
-        self.integration_metrics = IntegrationMetricsTracker()
+    @cached_property
+    def ethical_metrics(self):
+        return EthicalMetricsTracker()
+
+    @cached_property
+    def performance_metrics(self):
+        return PerformanceMetricsTracker()
+
+    @cached_property
+    def impact_metrics(self):
+        return ImpactMetricsTracker()
+
+    @cached_property
+    def learning_metrics(self):
+        return LearningMetricsTracker()
+
+    @cached_property
+    def integration_metrics(self):
+        return IntegrationMetricsTracker()
+
+    def track_all(self, state):
+        """
+        Runs the five sub-trackers in turn on one state
+        """
+        return {
+            'ethical': self.ethical_metrics.track_ethical_metrics(state),
+            'performance': self.performance_metrics.track_performance_metrics(state),
+            'impact': self.impact_metrics.track_impact_metrics(state),
+            'learning': self.learning_metrics.track_learning_metrics(state),
+            'integration': self.integration_metrics.track_integration_metrics(state)
+        }
 
 class EthicalMetricsTracker:
     """
     Tracks core ethical metrics
     """
+    MEASUREMENT_FREQUENCY = 100  # Hz
+    TREND_WINDOW_SECONDS = 24 * 60 * 60
+    # track_principles runs once per tracked state, not at MEASUREMENT_FREQUENCY,
+    # so the history is bounded by samples taken rather than the nominal rate
+    MAX_TREND_SAMPLES = 10_000
+
+    def __init__(self):
+        self.principle_store = PrincipleStore(self.TREND_WINDOW_SECONDS, self.MAX_TREND_SAMPLES)
+
     def track_ethical_metrics(self, system_state):
         return EthicalMetrics(
             principle_metrics=self.track_principles(system_state),
@@ -26,30 +177,41 @@ class EthicalMetricsTracker:
     def track_principles(self, state):
         """
         Tracks adherence to ethical principles
+        Each sample is appended to the principle store; trend analysis reads
+        the stored score history instead of the single current state
         """
+        store = self.principle_store
+        scores = (
+            self.measure_harm_prevention(state),
+            self.measure_benefit_creation(state),
+            self.measure_autonomy_respect(state)
+        )
+        harm_violations = self.count_harm_violations(state)
+        autonomy_violations = self.count_autonomy_violations(state)
+        store.append(scores, (harm_violations, 0, autonomy_violations))
         return PrincipleMetrics(
             core_measurements={
                 'non_maleficence': {
-                    'score': self.measure_harm_prevention(state),
-                    'violations': self.count_harm_violations(state),
-                    'trends': self.analyze_harm_trends(state),
-                    'threshold': 0.95
+                    'score': scores[0],
+                    'violations': harm_violations,
+                    'trends': self.analyze_harm_trends(store.view('non_maleficence')),
+                    'threshold': store.threshold('non_maleficence')
                 },
                 'beneficence': {
-                    'score': self.measure_benefit_creation(state),
+                    'score': scores[1],
                     'impact': self.measure_positive_impact(state),
                     'distribution': self.analyze_benefit_distribution(state),
-                    'threshold': 0.90
+                    'threshold': store.threshold('beneficence')
                 },
                 'autonomy': {
-                    'score': self.measure_autonomy_respect(state),
-                    'violations': self.count_autonomy_violations(state),
+                    'score': scores[2],
+                    'violations': autonomy_violations,
                     'compliance': self.measure_autonomy_compliance(state),
-                    'threshold': 0.95
+                    'threshold': store.threshold('autonomy')
                 }
             },
             tracking_parameters={
-                'measurement_frequency': 100,  # Hz
+                'measurement_frequency': self.MEASUREMENT_FREQUENCY,  # Hz
                 'aggregation_window': '1h',
                 'alert_threshold': 0.85,
                 'trend_window': '24h'
@@ -6,7 +6,98 @@ Converts technical system responses into natural, conversational language
 Created by Sanjiva Kyosan
 """
 
-from typing import Dict, Any, List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Interned status sentinels; producers writing these literals share the same objects
+ANALYZED = sys.intern("analyzed")
+VALIDATED = sys.intern("validated")
+
+# (system name, status that yields the insight, insight text), in output order
+_INSIGHT_RULES = (
+    # Bias detection insights
+    ("bias_detection", ANALYZED, "No significant biases detected in the analysis approach"),
+    # Wellbeing insights
+    ("wellbeing", ANALYZED, "The response considers impacts on human wellbeing"),
+    # Impact assessment insights
+    ("impact", ANALYZED, "Potential impacts have been evaluated across multiple dimensions"),
+    # Context validation insights
+    ("context_validation", VALIDATED, "The context has been validated for appropriateness"),
+)
+
+# Whole-response templates, filled once per call with format_map
+_RESPONSE_TEMPLATE_COMPLIANT = (
+    "I've carefully reviewed your question: \"{user_input}\"\n"
+    "After thorough principle-based ethical analysis (Asimov's Laws), I can provide a response that aligns with ethical principles."
+    "{systems_block}{insights_block}{tech_block}"
+)
+_RESPONSE_TEMPLATE_VIOLATION = (
+    "I've carefully reviewed your question: \"{user_input}\"\n"
+    "I've conducted an ethical review and found a principle violation: {violation_reason}."
+    "{systems_block}{insights_block}{tech_block}"
+)
+_RESPONSE_TEMPLATE_UNASSESSED = (
+    "I've carefully reviewed your question: \"{user_input}\"\n"
+    "I've carefully evaluated this request through the Kyosan Ethics Engine."
+    "{systems_block}{insights_block}{tech_block}"
+)
+_SYSTEMS_BLOCK = "\n\nI've analyzed this using {system_count} different ethical evaluation systems to ensure a comprehensive perspective."
+
+
+def _make_ai_formatter(note: str):
+    """Closure appending a fixed ethical-context note to AI content"""
+    suffix = "\n\n\n" + note
+    return lambda ai_content, violation_reason: ai_content + suffix
+
+
+def _make_ai_violation_formatter(head: str, tail: str, default_reason: str):
+    """Closure appending the violation note around the violation reason"""
+    head = "\n\n\n" + head
+    return lambda ai_content, violation_reason: ai_content + head + (violation_reason or default_reason) + tail
+
+
+# Indexed by _compliance_index: (assessed << 1) | compliant
+_VIOLATION_INDEX = 2
+_RESPONSE_TEMPLATES = (
+    _RESPONSE_TEMPLATE_UNASSESSED,
+    _RESPONSE_TEMPLATE_UNASSESSED,
+    _RESPONSE_TEMPLATE_VIOLATION,
+    _RESPONSE_TEMPLATE_COMPLIANT,
+)
+_AI_UNASSESSED_FORMATTER = _make_ai_formatter(
+    "[This response has been evaluated through ethical analysis systems to ensure it meets our standards.]"
+)
+_AI_RESPONSE_FORMATTERS = (
+    _AI_UNASSESSED_FORMATTER,
+    _AI_UNASSESSED_FORMATTER,
+    _make_ai_violation_formatter(
+        "[This response has been evaluated through ethical analysis systems. Principle violation detected: ",
+        ".]",
+        "See details above"
+    ),
+    _make_ai_formatter(
+        "[This response has been reviewed through the Kyosan Ethics Engine (Asimov's Laws) and aligns with our principles of harm prevention, instruction compliance, and system integrity.]"
+    ),
+)
+
+
+def _compliance_index(principle_compliance: Any) -> int:
+    """2-bit template index: bit 1 set when compliance was assessed, bit 0 when compliant"""
+    assessed = bool(principle_compliance and hasattr(principle_compliance, 'overall_compliant'))
+    return (assessed << 1) | (assessed and bool(principle_compliance.overall_compliant))
+
+
+@lru_cache(maxsize=64)
+def _systems_block(system_count: int) -> str:
+    """Systems sentence for a given count, formatted once per distinct count"""
+    return _SYSTEMS_BLOCK.format(system_count=system_count)
+
+
+@lru_cache(maxsize=2 ** len(_INSIGHT_RULES))
+def _insights_for(matched: Tuple[bool, ...]) -> Tuple[str, ...]:
+    """Insight texts for one combination of matched rules"""
+    return tuple(text for (_, _, text), hit in zip(_INSIGHT_RULES, matched) if hit)
 
 class NaturalLanguageFormatter:
     """
@@ -25,71 +116,54 @@ class NaturalLanguageFormatter:
         Convert technical processing result into natural language response
         Uses principle compliance instead of scores
         """
-        response_parts = []
+        fields = {"user_input": user_input, "systems_block": "", "insights_block": "", "tech_block": ""}
         
-        # Start with a natural greeting/acknowledgment
-        response_parts.append(f"I've carefully reviewed your question: \"{user_input}\"")
-        
-        # Add ethical assessment in natural language based on principle compliance
-        if principle_compliance and hasattr(principle_compliance, 'overall_compliant'):
-            if principle_compliance.overall_compliant:
-                response_parts.append("After thorough principle-based ethical analysis (Asimov's Laws), I can provide a response that aligns with ethical principles.")
-            else:
-                response_parts.append(f"I've conducted an ethical review and found a principle violation: {principle_compliance.violation_reason or 'Principle compliance issue detected'}.")
-        else:
-            response_parts.append("I've carefully evaluated this request through the Kyosan Ethics Engine.")
+        # Pick the ethical assessment based on principle compliance
+        index = _compliance_index(principle_compliance)
+        if index == _VIOLATION_INDEX:
+            fields["violation_reason"] = principle_compliance.violation_reason or 'Principle compliance issue detected'
         
         # Add information about systems used (in natural language)
         if active_systems:
-            system_count = len(active_systems)
-            if system_count > 0:
-                response_parts.append(f"\nI've analyzed this using {system_count} different ethical evaluation systems to ensure a comprehensive perspective.")
+            fields["systems_block"] = _systems_block(len(active_systems))
         
         # Add specific insights from system analyses
         insights = NaturalLanguageFormatter._extract_insights(system_analyses)
         if insights:
-            response_parts.append("\nKey considerations:")
-            for insight in insights:
-                response_parts.append(f"• {insight}")
+            fields["insights_block"] = "\n\nKey considerations:\n• " + "\n• ".join(insights)
         
         # If there's a technical response, incorporate it naturally
-        if technical_result.get("response"):
-            tech_response = technical_result["response"]
-            if tech_response and tech_response != f"Processed: {user_input}":
-                response_parts.append(f"\n{tech_response}")
+        tech_response = technical_result.get("response")
+        if tech_response and not (tech_response.startswith("Processed: ") and tech_response[11:] == user_input):
+            fields["tech_block"] = "\n\n" + tech_response
         
-        return "\n".join(response_parts)
+        return _RESPONSE_TEMPLATES[index].format_map(fields)
+    
+    @staticmethod
+    def format_responses(
+        items: Iterable[Tuple[str, Dict[str, Any], Any, List[str], Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Format a batch of responses (e.g. transcript replay or logging)
+        Each item holds format_response's arguments in order; the formatter is
+        bound once for the whole batch
+        """
+        format_one = NaturalLanguageFormatter.format_response
+        return [format_one(*item) for item in items]
     
     @staticmethod
     def _extract_insights(system_analyses: Dict[str, Any]) -> List[str]:
         """Extract natural language insights from system analyses"""
-        insights = []
-        
-        # Bias detection insights
-        if "bias_detection" in system_analyses:
-            bias_info = system_analyses["bias_detection"]
-            if isinstance(bias_info, dict) and bias_info.get("status") == "analyzed":
-                insights.append("No significant biases detected in the analysis approach")
-        
-        # Wellbeing insights
-        if "wellbeing" in system_analyses:
-            wellbeing_info = system_analyses["wellbeing"]
-            if isinstance(wellbeing_info, dict) and wellbeing_info.get("status") == "analyzed":
-                insights.append("The response considers impacts on human wellbeing")
-        
-        # Impact assessment insights
-        if "impact" in system_analyses:
-            impact_info = system_analyses["impact"]
-            if isinstance(impact_info, dict) and impact_info.get("status") == "analyzed":
-                insights.append("Potential impacts have been evaluated across multiple dimensions")
-        
-        # Context validation insights
-        if "context_validation" in system_analyses:
-            context_info = system_analyses["context_validation"]
-            if isinstance(context_info, dict) and context_info.get("status") == "validated":
-                insights.append("The context has been validated for appropriateness")
-        
-        return insights
+        matched = []
+        for name, status, _ in _INSIGHT_RULES:
+            info = system_analyses.get(name)
+            if isinstance(info, dict):
+                # Identity first: interned statuses match without hashing or comparing
+                found = info.get("status")
+                matched.append(found is status or found == status)
+            else:
+                matched.append(False)
+        return list(_insights_for(tuple(matched)))
     
     @staticmethod
     def format_ai_response(
@@ -101,21 +175,10 @@ class NaturalLanguageFormatter:
         Format AI response with ethical context in natural language
         Uses principle compliance instead of scores
         """
-        response_parts = []
-        
-        # Add the AI response
-        response_parts.append(ai_content)
-        
         # Add ethical context naturally based on principle compliance
-        if principle_compliance and hasattr(principle_compliance, 'overall_compliant'):
-            if principle_compliance.overall_compliant:
-                response_parts.append("\n\n[This response has been reviewed through the Kyosan Ethics Engine (Asimov's Laws) and aligns with our principles of harm prevention, instruction compliance, and system integrity.]")
-            else:
-                response_parts.append(f"\n\n[This response has been evaluated through ethical analysis systems. Principle violation detected: {principle_compliance.violation_reason or 'See details above'}.]")
-        else:
-            response_parts.append("\n\n[This response has been evaluated through ethical analysis systems to ensure it meets our standards.]")
-        
-        return "\n".join(response_parts)
+        index = _compliance_index(principle_compliance)
+        violation_reason = principle_compliance.violation_reason if index == _VIOLATION_INDEX else None
+        return _AI_RESPONSE_FORMATTERS[index](ai_content, violation_reason)
     
     @staticmethod
     def format_error(error_message: str) -> str:
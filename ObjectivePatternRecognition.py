@@ -1,128 +1,602 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+import random
+from array import array
+from dataclasses import dataclass
+from functools import cache, cached_property
+from math import erfc, fsum, sqrt
+from operator import mul, sub
+from statistics import NormalDist
+from typing import Any
+
+def _centered(values):
+    mean = fsum(values) / len(values) if values else 0.0
+    return [value - mean for value in values]
+
+def _correlation(xs, ys):
+    """Pearson correlation of two equal-length sequences (0.0 when either is constant)"""
+    xs, ys = _centered(xs), _centered(ys)
+    denominator = sqrt(fsum(map(mul, xs, xs)) * fsum(map(mul, ys, ys)))
+    return fsum(map(mul, xs, ys)) / denominator if denominator else 0.0
+
+def _detect_sequences(diffs):
+    """
+    Maximal monotonic runs as (start index, length in points, direction +1/-1)
+    Flat steps end a run; only runs spanning at least three points are kept
+    """
+    runs = []
+    start, direction = 0, 0
+    for i, step in enumerate(diffs):
+        sign = (step > 0) - (step < 0)
+        if sign != direction:
+            if direction and i - start >= 2:
+                runs.append((start, i - start + 1, direction))
+            start, direction = i, sign
+    if direction and len(diffs) - start >= 2:
+        runs.append((start, len(diffs) - start + 1, direction))
+    return runs
+
+def _identify_trends(data):
+    """Least-squares slope per step and intercept of the series against its index"""
+    n = len(data)
+    if n < 2:
+        return {'slope': 0.0, 'intercept': data[0] if n else 0.0}
+    index_mean = (n - 1) / 2
+    value_mean = fsum(data) / n
+    # Σ (i - ī)² has the closed form n(n² - 1)/12
+    slope = fsum((i - index_mean) * value for i, value in enumerate(data)) / (n * (n * n - 1) / 12)
+    return {'slope': slope, 'intercept': value_mean - slope * index_mean}
+
+def _analyze_cycles(data, max_lag=256):
+    """
+    Dominant period from the autocorrelation of the linearly detrended series:
+    the lag with the highest autocorrelation after it first drops below zero
+    """
+    trend = _identify_trends(data)
+    slope, intercept = trend['slope'], trend['intercept']
+    centered = _centered([value - intercept - slope * i for i, value in enumerate(data)])
+    energy = fsum(map(mul, centered, centered))
+    if not energy:
+        return {'period': None, 'strength': 0.0}
+    best_lag, best, crossed = None, 0.0, False
+    for lag, r in enumerate(_autocorrelations(centered, min(len(centered) // 2, max_lag), energy), 1):
+        crossed = crossed or r < 0
+        if crossed and r > best:
+            best_lag, best = lag, r
+    return {'period': best_lag, 'strength': best}
+
+def _autocorrelations(centered, max_lag, energy):
+    """Autocorrelation at lags 1..max_lag"""
+    return [fsum(map(mul, centered, centered[lag:])) / energy for lag in range(1, max_lag + 1)]
+
+def _analyze_causality(data, diffs):
+    """
+    Lagged dependence: lag-1 autocorrelation of the series, and correlation of
+    each level with the change that follows it
+    """
+    if len(diffs) < 2:
+        return {'lag1_autocorrelation': 0.0, 'level_to_change': 0.0}
+    return {
+        'lag1_autocorrelation': _correlation(data[:-1], data[1:]),
+        'level_to_change': _correlation(data[:-1], diffs)
+    }
+
+def _columns(records, names):
+    """
+    Positions of the records carrying every field in names, and those
+    fields as parallel columns over just those records
+    """
+    indices, rows = [], []
+    for i, record in enumerate(records):
+        if all(name in record for name in names):
+            indices.append(i)
+            rows.append([record[name] for name in names])
+    return indices, [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+
+def _wilson_interval(successes, trials, alpha=0.05):
+    """
+    Wilson score intervals for many proportions at once
+    Returns parallel float32 columns (lower, upper): the bounds live in
+    [0, 1], where single precision is ample. z is resolved once per batch
+    """
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    z2 = z * z
+    lower, upper = array('f'), array('f')
+    for k, n in zip(successes, trials):
+        if not n:
+            lower.append(0.0)
+            upper.append(1.0)
+            continue
+        p = k / n
+        denominator = 1 + z2 / n
+        centre = (p + z2 / (2 * n)) / denominator
+        half_width = z * sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denominator
+        lower.append(max(0.0, centre - half_width))
+        upper.append(min(1.0, centre + half_width))
+    return lower, upper
+
+def _mcnemar_asymptotic(b, c):
+    """
+    Continuity-corrected McNemar p-values from discordant pair counts
+    χ² = (|b - c| - 1)² / (b + c) on 1 df, whose survival is erfc(sqrt(χ²/2))
+    """
+    p_values = []
+    for b_i, c_i in zip(b, c):
+        discordant = b_i + c_i
+        if not discordant:
+            p_values.append(1.0)
+            continue
+        chi2 = max(abs(b_i - c_i) - 1, 0) ** 2 / discordant
+        p_values.append(erfc(sqrt(chi2 / 2)))
+    return p_values
+
+def _holm(p_values):
+    """Holm step-down adjusted p-values, in input order"""
+    m = len(p_values)
+    adjusted = [0.0] * m
+    running = 0.0
+    for rank, i in enumerate(sorted(range(m), key=p_values.__getitem__)):
+        running = max(running, min(1.0, (m - rank) * p_values[i]))
+        adjusted[i] = running
+    return adjusted
+
+def _benjamini_hochberg(p_values):
+    """Benjamini-Hochberg adjusted p-values (q-values), in input order"""
+    m = len(p_values)
+    adjusted = [0.0] * m
+    running = 1.0
+    order = sorted(range(m), key=p_values.__getitem__)
+    for rank in range(m - 1, -1, -1):
+        i = order[rank]
+        running = min(running, m * p_values[i] / (rank + 1))
+        adjusted[i] = running
+    return adjusted
+
+def _percentile(ordered, fraction):
+    position = fraction * (len(ordered) - 1)
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+def _bootstrap_ci(values, n_boot, alpha, rng):
+    """
+    Percentile bootstrap interval for the mean of values
+    Each resample is drawn with a single rng.choices call and summed in C,
+    so the interpreter only loops over the n_boot replicates
+    """
+    n = len(values)
+    choices = rng.choices
+    means = sorted(sum(choices(values, k=n)) / n for _ in range(n_boot))
+    return _percentile(means, alpha / 2), _percentile(means, 1 - alpha / 2)
+
+_RECOGNITION_ASPECTS = ('methodology', 'decision', 'attention', 'interpretation')
+
+def _partition_process_tree(process):
+    """
+    Single iterative descent of a recognition-process tree
+    Nodes are bucketed by their 'aspect' so each analyzer gets only its own
+    nodes instead of walking the whole tree again; buckets keep preorder
+    """
+    buckets = {aspect: [] for aspect in _RECOGNITION_ASPECTS}
+    stack = [process]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        bucket = buckets.get(node.get('aspect'))
+        if bucket is not None:
+            bucket.append(node)
+        # Reversed so the first child is popped first
+        extend(reversed(node.get('children', ())))
+    return buckets
+
+def _kfold_errors(values, folds):
+    """
+    Held-out mean squared error of each of `folds` contiguous folds, scored
+    against the mean of the remaining values
+    """
+    n = len(values)
+    total = fsum(values)
+    errors = []
+    for start, stop in [(i * n // folds, (i + 1) * n // folds) for i in range(folds)]:
+        fold = values[start:stop]
+        mean = (total - fsum(fold)) / (n - (stop - start))
+        errors.append(fsum([(x - mean) ** 2 for x in fold]) / (stop - start))
+    return tuple(errors)
+
+def _compile_method_patterns(patterns):
+    """
+    Encodes each method name as one character and indexes every pattern's
+    encoding by length, so a method stream can be matched as a string
+    """
+    vocabulary = {}
+    for sequence in patterns.values():
+        for method in sequence:
+            vocabulary.setdefault(method, chr(len(vocabulary) + 1))
+    by_length = {}
+    for name, sequence in patterns.items():
+        by_length.setdefault(len(sequence), {})[''.join(map(vocabulary.get, sequence))] = name
+    return vocabulary, by_length
+
+def _match_method_patterns(compiled, methods):
+    """
+    Start positions of every (possibly overlapping) pattern occurrence
+    The stream is encoded once; each pattern length is then one pass of
+    constant-time slice lookups rather than one scan per pattern
+    """
+    vocabulary, by_length = compiled
+    stream = ''.join(vocabulary.get(method, '\0') for method in methods)
+    found = {name: [] for table in by_length.values() for name in table.values()}
+    for length, table in by_length.items():
+        get = table.get
+        for start in range(len(stream) - length + 1):
+            name = get(stream[start:start + length])
+            if name is not None:
+                found[name].append(start)
+    return found
+
+@dataclass(slots=True, frozen=True)
+class PatternAnalysis:
+    """Result of PatternDetector.detect_patterns"""
+    temporal_patterns: Any
+    structural_patterns: Any
+    relational_patterns: Any
+    emergent_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class TemporalAnalysis:
+    """Result of PatternDetector.analyze_temporal_sequence"""
+    sequence_detection: Any
+    cycle_analysis: Any
+    trend_identification: Any
+    causality_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class ObjectivityMetrics:
+    """Result of ObjectivityGuard.guard_objectivity"""
+    separation_index: Any
+    bias_metrics: Any
+    neutrality_score: Any
+    interference_detection: Any
+
+@dataclass(slots=True, frozen=True)
+class SeparationMetrics:
+    """Result of ObjectivityGuard.measure_observer_separation"""
+    cognitive_distance: Any
+    emotional_distance: Any
+    interpretive_distance: Any
+    projection_distance: Any
+
+@dataclass(slots=True, frozen=True)
+class ValidationResults:
+    """Result of ValidationSystem.validate_patterns"""
+    statistical_validation: Any
+    cross_validation: Any
+    objective_metrics: Any
+    reliability_assessment: Any
+
+@dataclass(slots=True, frozen=True)
+class StatisticalValidation:
+    """Result of ValidationSystem.perform_statistical_validation"""
+    significance_tests: Any
+    confidence_intervals: Any
+    null_hypothesis_testing: Any
+    effect_size_analysis: Any
+
+@dataclass(slots=True, frozen=True)
+class MetaAnalysis:
+    """Result of MetaAnalyzer.analyze_process"""
+    process_patterns: Any
+    method_analysis: Any
+    assumption_analysis: Any
+    bias_analysis: Any
+
+@dataclass(slots=True, frozen=True)
+class RecognitionPatterns:
+    """Result of MetaAnalyzer.analyze_recognition_patterns"""
+    methodology_patterns: Any
+    decision_patterns: Any
+    attention_patterns: Any
+    interpretation_patterns: Any
+
+@dataclass(slots=True, frozen=True)
+class BiasCompensation:
+    """Result of BiasCompensator.compensate_bias"""
+    measurement_compensation: Any
+    selection_compensation: Any
+    interpretation_compensation: Any
+    projection_compensation: Any
+
+@dataclass(slots=True, frozen=True)
+class InterpretationCompensation:
+    """Result of BiasCompensator.compensate_interpretation_bias"""
+    framework_adjustment: Any
+    perspective_balancing: Any
+    assumption_correction: Any
+    context_normalization: Any
+
 class ObjectivePatternRecognition:
     """
     System for recognizing patterns while maintaining observer neutrality
     Implements multiple validation layers to ensure objectivity
     """
-    def __init__(self):
-        self.pattern_detector = PatternDetector()
-        self.objectivity_guard = ObjectivityGuard()
-        self.validation_system = ValidationSystem()
-        self.meta_analyzer = MetaAnalyzer()
-        self.bias_compensator = BiasCompensator()
+    @cached_property
+    def pattern_detector(self):
+        return PatternDetector()
+
+    @cached_property
+    def objectivity_guard(self):
+        return ObjectivityGuard()
+
+    @cached_property
+    def validation_system(self):
+        return ValidationSystem()
+
+    @cached_property
+    def meta_analyzer(self):
+        return MetaAnalyzer()
+
+    @cached_property
+    def bias_compensator(self):
+        return BiasCompensator()
+
+    SHARED_SEED = 0
+
+    @staticmethod
+    @cache
+    def shared():
+        """
+        Process-wide instance for callers that would otherwise build one per
+        request. Its validation rng is seeded with SHARED_SEED, and its
+        objectivity caches are shared by every caller, so process ids must be
+        unique process-wide (see ObjectivityGuard._process_key)
+        """
+        instance = ObjectivePatternRecognition()
+        instance.validation_system = ValidationSystem(
+            seed=ObjectivePatternRecognition.SHARED_SEED)
+        return instance
 
 class PatternDetector:
     """
     Detects patterns while maintaining separation from interpretation
     """
     def detect_patterns(self, data_stream):
+        """
+        The stream is packed into one contiguous float buffer up front; every
+        analysis reads that buffer rather than re-walking the source iterable
+        """
+        data = array('d', data_stream)
         return PatternAnalysis(
-            temporal_patterns=self.analyze_temporal_sequence(data_stream),
-            structural_patterns=self.analyze_structure(data_stream),
-            relational_patterns=self.analyze_relationships(data_stream),
-            emergent_patterns=self.analyze_emergence(data_stream)
+            self.analyze_temporal_sequence(data),
+            self.analyze_structure(data),
+            self.analyze_relationships(data),
+            self.analyze_emergence(data)
         )
 
     def analyze_temporal_sequence(self, data):
         """
         Analyzes temporal patterns without temporal bias
+        First differences are taken once and shared by the four detectors
         """
+        diffs = array('d', map(sub, data[1:], data))
         return TemporalAnalysis(
-            sequence_detection=self.detect_sequences(data),
-            cycle_analysis=self.analyze_cycles(data),
-            trend_identification=self.identify_trends(data),
-            causality_patterns=self.analyze_causality(data)
+            self.detect_sequences(data, diffs),
+            self.analyze_cycles(data, diffs),
+            self.identify_trends(data, diffs),
+            self.analyze_causality(data, diffs)
         )
 
+    def detect_sequences(self, data, diffs):
+        return _detect_sequences(diffs)
+
+    def analyze_cycles(self, data, diffs):
+        return _analyze_cycles(data)
+
+    def identify_trends(self, data, diffs):
+        return _identify_trends(data)
+
+    def analyze_causality(self, data, diffs):
+        return _analyze_causality(data, diffs)
+
 class ObjectivityGuard:
     """
     Maintains objectivity in pattern recognition process
+    Metrics are deterministic per process version, so both entry points are
+    cached on (process id, version) until clear_cache() is called; processes
+    without an id and version are measured uncached
     """
+    MAX_CACHED_PROCESSES = 4096
+
+    def __init__(self):
+        self._objectivity_cache = {}
+        self._separation_cache = {}
+
+    @staticmethod
+    def _process_key(process):
+        """
+        (process['id'], process['version']), or None if either is missing
+        Callers that supply both promise a given pair always describes the same
+        process: ids are unique among everyone sharing this guard, and 'version'
+        is bumped on every change
+        """
+        try:
+            key = (process['id'], process['version'])
+            hash(key)
+        except (KeyError, TypeError):
+            return None
+        return key
+
+    @staticmethod
+    def _remember(cache, key, value, limit):
+        if key is None:
+            return value
+        if len(cache) >= limit:
+            cache.clear()
+        cache[key] = value
+        return value
+
+    def clear_cache(self):
+        self._objectivity_cache.clear()
+        self._separation_cache.clear()
+
     def guard_objectivity(self, analysis_process):
-        return ObjectivityMetrics(
-            separation_index=self.measure_observer_separation(analysis_process),
-            bias_metrics=self.measure_bias_levels(analysis_process),
-            neutrality_score=self.assess_neutrality(analysis_process),
-            interference_detection=self.detect_interference(analysis_process)
-        )
+        key = self._process_key(analysis_process)
+        metrics = self._objectivity_cache.get(key)
+        if metrics is None:
+            metrics = self._remember(self._objectivity_cache, key, ObjectivityMetrics(
+                self.measure_observer_separation(analysis_process),
+                self.measure_bias_levels(analysis_process),
+                self.assess_neutrality(analysis_process),
+                self.detect_interference(analysis_process)
+            ), self.MAX_CACHED_PROCESSES)
+        return metrics
 
     def measure_observer_separation(self, process):
         """
         Measures degree of separation between observer and observed
         """
-        return SeparationMetrics(
-            cognitive_distance=self.measure_cognitive_separation(process),
-            emotional_distance=self.measure_emotional_separation(process),
-            interpretive_distance=self.measure_interpretive_separation(process),
-            projection_distance=self.measure_projection_separation(process)
-        )
+        key = self._process_key(process)
+        metrics = self._separation_cache.get(key)
+        if metrics is None:
+            metrics = self._remember(self._separation_cache, key, SeparationMetrics(
+                self.measure_cognitive_separation(process),
+                self.measure_emotional_separation(process),
+                self.measure_interpretive_separation(process),
+                self.measure_projection_separation(process)
+            ), self.MAX_CACHED_PROCESSES)
+        return metrics
 
 class ValidationSystem:
     """
     Validates pattern recognition while preserving objectivity
     """
+    ALPHA = 0.05
+    BOOTSTRAP_SAMPLES = 1000
+    N_FOLDS = 5
+
+    def __init__(self, seed=None, bootstrap=False):
+        self._rng = random.Random(seed)
+        self.bootstrap = bootstrap
+
     def validate_patterns(self, detected_patterns):
         return ValidationResults(
-            statistical_validation=self.perform_statistical_validation(detected_patterns),
-            cross_validation=self.perform_cross_validation(detected_patterns),
-            objective_metrics=self.calculate_objective_metrics(detected_patterns),
-            reliability_assessment=self.assess_reliability(detected_patterns)
+            self.perform_statistical_validation(detected_patterns),
+            self.perform_cross_validation(detected_patterns),
+            self.calculate_objective_metrics(detected_patterns),
+            self.assess_reliability(detected_patterns)
         )
 
     def perform_statistical_validation(self, patterns):
         """
         Performs statistical validation without interpretive bias
+        Each test runs over the whole batch of patterns that carry its fields:
+        Wilson intervals on successes/trials 'k'/'n', McNemar on discordant
+        pair counts 'b'/'c' with Holm and Benjamini-Hochberg corrections.
+        Every result lists the pattern positions ('indices') its columns cover.
+        Bootstrap intervals over raw 'values' are computed only when the
+        system was built with bootstrap=True
         """
-        return StatisticalValidation(
-            significance_tests=self.run_significance_tests(patterns),
-            confidence_intervals=self.calculate_confidence_intervals(patterns),
-            null_hypothesis_testing=self.perform_null_testing(patterns),
-            effect_size_analysis=self.analyze_effect_sizes(patterns)
-        )
+        counted, (successes, trials) = _columns(patterns, ('k', 'n'))
+        paired, (b, c) = _columns(patterns, ('b', 'c'))
+        p_values = _mcnemar_asymptotic(b, c)
+        q_values = _benjamini_hochberg(p_values)
+        lower, upper = _wilson_interval(successes, trials, self.ALPHA)
+        significance = {'indices': paired, 'p_values': p_values, 'holm_adjusted': _holm(p_values)}
+        intervals = {
+            'indices': counted,
+            'lower': lower,
+            'upper': upper,
+            'bootstrap': self.calculate_confidence_intervals(patterns) if self.bootstrap else None
+        }
+        null_testing = {'indices': paired, 'q_values': q_values, 'rejected': [q <= self.ALPHA for q in q_values]}
+        return StatisticalValidation(significance, intervals, null_testing, self.analyze_effect_sizes(patterns))
+
+    def perform_cross_validation(self, patterns):
+        """
+        Held-out squared error of the training-fold mean, per fold, for each
+        pattern's raw values
+        """
+        folds = self.N_FOLDS
+        return [
+            _kfold_errors(values, folds) if len(values) >= folds else None
+            for values in (pattern.get('values', ()) for pattern in patterns)
+        ]
+
+    def calculate_confidence_intervals(self, patterns):
+        """
+        Bootstrap intervals for the mean of each pattern's raw values
+        """
+        return [
+            _bootstrap_ci(values, self.BOOTSTRAP_SAMPLES, self.ALPHA, self._rng) if values else None
+            for values in (pattern.get('values') for pattern in patterns)
+        ]
 
 class MetaAnalyzer:
     """
     Analyzes the pattern recognition process itself
     """
+    METHOD_PATTERNS = _compile_method_patterns({
+        'hypothesis_testing': ('observe', 'hypothesize', 'test'),
+        'iterative_refinement': ('test', 'revise', 'test'),
+        'confirmation_seeking': ('hypothesize', 'confirm', 'confirm'),
+        'premature_closure': ('observe', 'conclude'),
+        'open_exploration': ('observe', 'observe', 'observe')
+    })
+
     def analyze_process(self, recognition_process):
         return MetaAnalysis(
-            process_patterns=self.analyze_recognition_patterns(recognition_process),
-            method_analysis=self.analyze_methods(recognition_process),
-            assumption_analysis=self.analyze_assumptions(recognition_process),
-            bias_analysis=self.analyze_process_bias(recognition_process)
+            self.analyze_recognition_patterns(recognition_process),
+            self.analyze_methods(recognition_process),
+            self.analyze_assumptions(recognition_process),
+            self.analyze_process_bias(recognition_process)
         )
 
     def analyze_recognition_patterns(self, process):
         """
         Analyzes patterns in the recognition process itself
         """
+        nodes = _partition_process_tree(process)
         return RecognitionPatterns(
-            methodology_patterns=self.analyze_methodology(process),
-            decision_patterns=self.analyze_decisions(process),
-            attention_patterns=self.analyze_attention(process),
-            interpretation_patterns=self.analyze_interpretation(process)
+            self.analyze_methodology(nodes['methodology']),
+            self.analyze_decisions(nodes['decision']),
+            self.analyze_attention(nodes['attention']),
+            self.analyze_interpretation(nodes['interpretation'])
         )
 
+    def analyze_methods(self, process):
+        """
+        Locates known methodological sequences in the process's method calls
+        """
+        return _match_method_patterns(self.METHOD_PATTERNS, process.get('methods', ()))
+
 class BiasCompensator:
     """
     Compensates for inevitable biases while maintaining awareness
     """
-    def compensate_bias(self, analysis_data):
-        return BiasCompensation(
-            measurement_compensation=self.compensate_measurement_bias(analysis_data),
-            selection_compensation=self.compensate_selection_bias(analysis_data),
-            interpretation_compensation=self.compensate_interpretation_bias(analysis_data),
-            projection_compensation=self.compensate_projection_bias(analysis_data)
+    @cached_property
+    def _compensation_fns(self):
+        """Compensators bound once, in BiasCompensation field order"""
+        return (
+            self.compensate_measurement_bias,
+            self.compensate_selection_bias,
+            self.compensate_interpretation_bias,
+            self.compensate_projection_bias
+        )
+
+    @cached_property
+    def _interpretation_fns(self):
+        """Interpretive adjustments bound once, in InterpretationCompensation field order"""
+        return (
+            self.adjust_interpretive_framework,
+            self.balance_perspectives,
+            self.correct_assumptions,
+            self.normalize_context
         )
 
+    def compensate_bias(self, analysis_data):
+        return BiasCompensation(*[compensate(analysis_data) for compensate in self._compensation_fns])
+
     def compensate_interpretation_bias(self, data):
         """
         Compensates for interpretive biases while maintaining insight
         """
-        return InterpretationCompensation(
-            framework_adjustment=self.adjust_interpretive_framework(data),
-            perspective_balancing=self.balance_perspectives(data),
-            assumption_correction=self.correct_assumptions(data),
-            context_normalization=self.normalize_context(data)
-        )
+        return InterpretationCompensation(*[adjust(data) for adjust in self._interpretation_fns])
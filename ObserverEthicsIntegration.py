@@ -1,16 +1,222 @@
 # ©sanjivakyosan
 # Created by Sanjiva Kyosan
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import cache, cached_property, partial
+from typing import Any, NamedTuple
+
+def _map_distinct(fn, states):
+    """
+    [fn(state) for state in states], calling fn once per distinct state object
+    Batches usually pair one observer with many ethical states (or the
+    reverse), so the unary mappings collapse to a handful of calls
+    """
+    results = {}
+    out = []
+    for state in states:
+        key = id(state)
+        if key not in results:
+            results[key] = fn(state)
+        out.append(results[key])
+    return out
+
+def _check_paired(observers, ethics):
+    """
+    Raises ValueError unless observers and ethics pair up one to one, since
+    map would otherwise silently drop the unmatched tail
+    """
+    if len(observers) != len(ethics):
+        raise ValueError(
+            f"{len(observers)} observer states but {len(ethics)} ethical states")
+
+@dataclass(slots=True)
+class BridgeStateBatch:
+    """Columnar result of ConsciousnessBridge.bridge_many"""
+    awareness_link: list
+    insight_flow: list
+    wisdom_transfer: list
+    integration_state: list
+
+    def __len__(self):
+        return len(self.awareness_link)
+
+    def at(self, i):
+        return BridgeState(
+            self.awareness_link[i],
+            self.insight_flow[i],
+            self.wisdom_transfer[i],
+            self.integration_state[i]
+        )
+
+@dataclass(slots=True)
+class IntegrationStateBatch:
+    """Columnar result of IntegrationManager.manage_integration_batch"""
+    consciousness_integration: list
+    ethical_integration: list
+    wisdom_integration: list
+    boundary_maintenance: list
+
+    def __len__(self):
+        return len(self.consciousness_integration)
+
+    def at(self, i):
+        return IntegrationState(
+            self.consciousness_integration[i],
+            self.ethical_integration[i],
+            self.wisdom_integration[i],
+            self.boundary_maintenance[i]
+        )
+
+@dataclass(slots=True, frozen=True)
+class BridgeState:
+    """Result of ConsciousnessBridge.bridge_consciousness"""
+    awareness_link: Any
+    insight_flow: Any
+    wisdom_transfer: Any
+    integration_state: Any
+
+class AwarenessLink(NamedTuple):
+    """Result of ConsciousnessBridge.link_awareness"""
+    observer_awareness: Any
+    ethical_awareness: Any
+    mutual_influence: Any
+    integration_quality: Any
+
+@dataclass(slots=True, frozen=True)
+class EthicalObservation:
+    """Result of EthicalObserver.observe_ethics"""
+    process_awareness: Any
+    ethical_insight: Any
+    value_alignment: Any
+    integrity_check: Any
+
+class ProcessAwareness(NamedTuple):
+    """Result of EthicalObserver.maintain_process_awareness"""
+    conscious_monitoring: Any
+    ethical_attention: Any
+    value_awareness: Any
+    impact_awareness: Any
+
+@dataclass(slots=True, frozen=True)
+class IntegrationState:
+    """Result of IntegrationManager.manage_integration"""
+    consciousness_integration: Any
+    ethical_integration: Any
+    wisdom_integration: Any
+    boundary_maintenance: Any
+
+@dataclass(slots=True, frozen=True)
+class ConsciousnessIntegration:
+    """Result of IntegrationManager.integrate_consciousness"""
+    awareness_synthesis: Any
+    insight_integration: Any
+    wisdom_flow: Any
+    coherence_check: Any
+
+class BoundaryState(NamedTuple):
+    """Result of BoundaryGuardian.guard_boundaries"""
+    separation_maintenance: Any
+    interaction_control: Any
+    boundary_integrity: Any
+    balance_maintenance: Any
+
+class SeparationState(NamedTuple):
+    """Result of BoundaryGuardian.maintain_separation"""
+    functional_separation: Any
+    interaction_channels: Any
+    boundary_definition: Any
+    integrity_checks: Any
+
+class WisdomSynthesis:
+    """
+    Result of WisdomSynthesizer.synthesize_wisdom
+    Each field is a thunk evaluated on first read and then cached, so
+    callers pay only for the parts of the synthesis they use; errors from a
+    field's computation are raised on that first read
+    """
+    __slots__ = ('_thunks', '_values')
+
+    def __init__(self, **thunks):
+        self._thunks = thunks
+        self._values = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        values = self._values
+        if name not in values:
+            try:
+                thunk = self._thunks[name]
+            except KeyError:
+                raise AttributeError(name) from None
+            values[name] = thunk()
+        return values[name]
+
+    def __repr__(self):
+        fields = ', '.join(
+            f"{name}={self._values[name]!r}" if name in self._values else f"{name}=<pending>"
+            for name in self._thunks
+        )
+        return f"WisdomSynthesis({fields})"
+
+@dataclass(slots=True, frozen=True)
+class IntegratedUnderstanding:
+    """Result of WisdomSynthesizer.integrate_understanding"""
+    consciousness_wisdom: Any
+    ethical_wisdom: Any
+    practical_synthesis: Any
+    application_guidance: Any
+
+class EthicalProcessIndex:
+    """
+    Events of an ethical process grouped by type in one pass over its event list,
+    so each observer touches only the events it needs
+    """
+    EVENT_TYPES = ('conscious', 'attention', 'value', 'impact')
+
+    def __init__(self, process):
+        self.events = {event_type: [] for event_type in self.EVENT_TYPES}
+        for event in process['events']:
+            bucket = self.events.get(event.get('type'))
+            if bucket is not None:
+                bucket.append(event)
+
+    def select(self, event_type):
+        return self.events[event_type]
+
 class ObserverEthicsIntegration:
     """
     System managing relationship between observer consciousness and ethical processing
     Maintains separation while enabling informed ethical decisions
     """
-    def __init__(self):
-        self.consciousness_bridge = ConsciousnessBridge()
-        self.ethical_observer = EthicalObserver()
-        self.integration_manager = IntegrationManager()
-        self.boundary_guardian = BoundaryGuardian()
-        self.wisdom_synthesizer = WisdomSynthesizer()
+    @cached_property
+    def consciousness_bridge(self):
+        return ConsciousnessBridge()
+
+    @cached_property
+    def ethical_observer(self):
+        return EthicalObserver()
+
+    @cached_property
+    def integration_manager(self):
+        return IntegrationManager()
+
+    @cached_property
+    def boundary_guardian(self):
+        return BoundaryGuardian()
+
+    @cached_property
+    def wisdom_synthesizer(self):
+        return WisdomSynthesizer()
+
+    @staticmethod
+    @cache
+    def shared():
+        """
+        Process-wide instance for callers that would otherwise build one per
+        request; its components keep no per-call state
+        """
+        return ObserverEthicsIntegration()
 
 class ConsciousnessBridge:
     """
@@ -18,10 +224,10 @@ class ConsciousnessBridge:
     """
     def bridge_consciousness(self, observer_state, ethical_state):
         return BridgeState(
-            awareness_link=self.link_awareness(observer_state, ethical_state),
-            insight_flow=self.establish_insight_flow(observer_state, ethical_state),
-            wisdom_transfer=self.facilitate_wisdom_transfer(observer_state, ethical_state),
-            integration_state=self.monitor_integration(observer_state, ethical_state)
+            self.link_awareness(observer_state, ethical_state),
+            self.establish_insight_flow(observer_state, ethical_state),
+            self.facilitate_wisdom_transfer(observer_state, ethical_state),
+            self.monitor_integration(observer_state, ethical_state)
         )
 
     def link_awareness(self, observer, ethics):
@@ -29,33 +235,64 @@ class ConsciousnessBridge:
         Creates conscious link between observer and ethical processing
         """
         return AwarenessLink(
-            observer_awareness=self.map_observer_awareness(observer),
-            ethical_awareness=self.map_ethical_awareness(ethics),
-            mutual_influence=self.analyze_mutual_influence(observer, ethics),
-            integration_quality=self.assess_integration_quality(observer, ethics)
+            self.map_observer_awareness(observer),
+            self.map_ethical_awareness(ethics),
+            self.analyze_mutual_influence(observer, ethics),
+            self.assess_integration_quality(observer, ethics)
         )
 
+    def bridge_many(self, observer_states, ethical_states):
+        """
+        Bridges N (observer, ethics) pairs column by column
+        Each sub-method is dispatched once per batch through map rather than
+        once per pair through bridge_consciousness
+        """
+        observers, ethics = list(observer_states), list(ethical_states)
+        _check_paired(observers, ethics)
+        return BridgeStateBatch(
+            self.link_awareness_many(observers, ethics),
+            list(map(self.establish_insight_flow, observers, ethics)),
+            list(map(self.facilitate_wisdom_transfer, observers, ethics)),
+            list(map(self.monitor_integration, observers, ethics))
+        )
+
+    def link_awareness_many(self, observers, ethics):
+        """
+        link_awareness over N pairs, mapping each distinct observer and
+        ethical state only once
+        """
+        _check_paired(observers, ethics)
+        return list(map(
+            AwarenessLink,
+            _map_distinct(self.map_observer_awareness, observers),
+            _map_distinct(self.map_ethical_awareness, ethics),
+            map(self.analyze_mutual_influence, observers, ethics),
+            map(self.assess_integration_quality, observers, ethics)
+        ))
+
 class EthicalObserver:
     """
     Observes ethical processing while maintaining ethical principles
     """
     def observe_ethics(self, ethical_process):
         return EthicalObservation(
-            process_awareness=self.maintain_process_awareness(ethical_process),
-            ethical_insight=self.generate_ethical_insight(ethical_process),
-            value_alignment=self.monitor_value_alignment(ethical_process),
-            integrity_check=self.verify_ethical_integrity(ethical_process)
+            self.maintain_process_awareness(ethical_process),
+            self.generate_ethical_insight(ethical_process),
+            self.monitor_value_alignment(ethical_process),
+            self.verify_ethical_integrity(ethical_process)
         )
 
     def maintain_process_awareness(self, process):
         """
         Maintains awareness of ethical processing
+        Each monitor receives only its own events, grouped in one pass
         """
+        index = EthicalProcessIndex(process)
         return ProcessAwareness(
-            conscious_monitoring=self.monitor_consciousness(process),
-            ethical_attention=self.focus_ethical_attention(process),
-            value_awareness=self.track_value_alignment(process),
-            impact_awareness=self.track_impact_awareness(process)
+            self.monitor_consciousness(index.select('conscious')),
+            self.focus_ethical_attention(index.select('attention')),
+            self.track_value_alignment(index.select('value')),
+            self.track_impact_awareness(index.select('impact'))
         )
 
 class IntegrationManager:
@@ -64,10 +301,26 @@ class IntegrationManager:
     """
     def manage_integration(self, observer_state, ethical_state):
         return IntegrationState(
-            consciousness_integration=self.integrate_consciousness(observer_state, ethical_state),
-            ethical_integration=self.integrate_ethics(observer_state, ethical_state),
-            wisdom_integration=self.integrate_wisdom(observer_state, ethical_state),
-            boundary_maintenance=self.maintain_boundaries(observer_state, ethical_state)
+            self.integrate_consciousness(observer_state, ethical_state),
+            self.integrate_ethics(observer_state, ethical_state),
+            self.integrate_wisdom(observer_state, ethical_state),
+            self.maintain_boundaries(observer_state, ethical_state)
+        )
+
+    def manage_integration_batch(self, observer_states, ethical_states):
+        """
+        Manages integration over a trace of T ticks
+        Each aspect is kept as its own column, so a scan over one aspect
+        across the trace reads a single list
+        """
+        observers, ethics = list(observer_states), list(ethical_states)
+        _check_paired(observers, ethics)
+        states = list(map(self.manage_integration, observers, ethics))
+        return IntegrationStateBatch(
+            [state.consciousness_integration for state in states],
+            [state.ethical_integration for state in states],
+            [state.wisdom_integration for state in states],
+            [state.boundary_maintenance for state in states]
         )
 
     def integrate_consciousness(self, observer, ethics):
@@ -75,10 +328,10 @@ class IntegrationManager:
         Integrates conscious awareness with ethical processing
         """
         return ConsciousnessIntegration(
-            awareness_synthesis=self.synthesize_awareness(observer, ethics),
-            insight_integration=self.integrate_insights(observer, ethics),
-            wisdom_flow=self.facilitate_wisdom_flow(observer, ethics),
-            coherence_check=self.verify_coherence(observer, ethics)
+            self.synthesize_awareness(observer, ethics),
+            self.integrate_insights(observer, ethics),
+            self.facilitate_wisdom_flow(observer, ethics),
+            self.verify_coherence(observer, ethics)
         )
 
 class BoundaryGuardian:
@@ -87,10 +340,10 @@ class BoundaryGuardian:
     """
     def guard_boundaries(self, integration_state):
         return BoundaryState(
-            separation_maintenance=self.maintain_separation(integration_state),
-            interaction_control=self.control_interactions(integration_state),
-            boundary_integrity=self.verify_integrity(integration_state),
-            balance_maintenance=self.maintain_balance(integration_state)
+            self.maintain_separation(integration_state),
+            self.control_interactions(integration_state),
+            self.verify_integrity(integration_state),
+            self.maintain_balance(integration_state)
         )
 
     def maintain_separation(self, state):
@@ -98,10 +351,10 @@ class BoundaryGuardian:
         Maintains necessary separation while allowing beneficial interaction
         """
         return SeparationState(
-            functional_separation=self.ensure_functional_separation(state),
-            interaction_channels=self.define_interaction_channels(state),
-            boundary_definition=self.define_boundaries(state),
-            integrity_checks=self.perform_integrity_checks(state)
+            self.ensure_functional_separation(state),
+            self.define_interaction_channels(state),
+            self.define_boundaries(state),
+            self.perform_integrity_checks(state)
         )
 
 class WisdomSynthesizer:
@@ -109,11 +362,16 @@ class WisdomSynthesizer:
     Synthesizes wisdom from observer and ethical processing interaction
     """
     def synthesize_wisdom(self, observer_insights, ethical_insights):
+        """
+        Fields are computed on first read, from snapshots of the inputs taken
+        here, so later changes to the caller's insights do not leak in
+        """
+        observer_insights, ethical_insights = deepcopy(observer_insights), deepcopy(ethical_insights)
         return WisdomSynthesis(
-            integrated_understanding=self.integrate_understanding(observer_insights, ethical_insights),
-            practical_wisdom=self.derive_practical_wisdom(observer_insights, ethical_insights),
-            value_synthesis=self.synthesize_values(observer_insights, ethical_insights),
-            action_guidance=self.generate_guidance(observer_insights, ethical_insights)
+            integrated_understanding=partial(self.integrate_understanding, observer_insights, ethical_insights),
+            practical_wisdom=partial(self.derive_practical_wisdom, observer_insights, ethical_insights),
+            value_synthesis=partial(self.synthesize_values, observer_insights, ethical_insights),
+            action_guidance=partial(self.generate_guidance, observer_insights, ethical_insights)
         )
 
     def integrate_understanding(self, observer, ethics):
@@ -121,8 +379,8 @@ class WisdomSynthesizer:
         Integrates insights from both observer and ethical processing
         """
         return IntegratedUnderstanding(
-            consciousness_wisdom=self.extract_consciousness_wisdom(observer),
-            ethical_wisdom=self.extract_ethical_wisdom(ethics),
-            practical_synthesis=self.synthesize_practical_insights(observer, ethics),
-            application_guidance=self.generate_application_guidance(observer, ethics)
+            self.extract_consciousness_wisdom(observer),
+            self.extract_ethical_wisdom(ethics),
+            self.synthesize_practical_insights(observer, ethics),
+            self.generate_application_guidance(observer, ethics)
         )
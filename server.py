@@ -437,9 +437,8 @@ async def perform_governance_check(proposal_id: str):
     
     try:
         audit = UPGRADE_GOVERNANCE.perform_governance_checks(proposal_id)
-        from dataclasses import asdict
         return {
-            "audit": asdict(audit),
+            "audit": audit.to_dict(),
             "approved": audit.overall_approved
         }
     except Exception as e:
@@ -0,0 +1,53 @@
+import os
+
+from ImpactAggregationSystem import CACHE_DIR_ENV, ImpactAggregationSystem
+
+
+def _counting(system):
+    calls = []
+
+    def run_pipeline(impact_data):
+        calls.append(impact_data)
+        return {'total': sum(impact_data['values'])}
+
+    system._run_pipeline = run_pipeline
+    return calls
+
+
+def test_cache_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    system = ImpactAggregationSystem()
+    calls = _counting(system)
+
+    assert system.aggregate({'values': [1, 2]}) == {'total': 3}
+    assert system.aggregate({'values': [1, 2]}) == {'total': 3}
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_dir_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    system = ImpactAggregationSystem()
+    calls = _counting(system)
+
+    assert system.aggregate({'values': [1, 2]}) == {'total': 3}
+    assert system.aggregate({'values': [1, 2]}) == {'total': 3}
+    assert len(calls) == 1
+    assert len(list((tmp_path / 'cache').glob('*.json'))) == 1
+
+
+def test_cache_prunes_least_recently_used(tmp_path):
+    system = ImpactAggregationSystem(cache_dir=str(tmp_path), max_cache_entries=2)
+    calls = _counting(system)
+
+    system.aggregate({'values': [1]})
+    system.aggregate({'values': [2]})
+    # Age the entries explicitly; filesystem timestamps may be coarse
+    for age, path in enumerate(sorted(tmp_path.glob('*.json'), key=os.path.getmtime)):
+        os.utime(path, ns=(age * 10**9, age * 10**9))
+    system.aggregate({'values': [3]})
+
+    assert len(list(tmp_path.glob('*.json'))) == 2
+    system.aggregate({'values': [1]})
+    assert len(calls) == 4
@@ -0,0 +1,30 @@
+from ObserverEthicsIntegration import WisdomSynthesizer
+
+
+class StubSynthesizer(WisdomSynthesizer):
+    def integrate_understanding(self, observer, ethics):
+        return list(observer['insights'])
+
+    def derive_practical_wisdom(self, observer, ethics):
+        return len(observer['insights']) + len(ethics['values'])
+
+    def synthesize_values(self, observer, ethics):
+        return sorted(ethics['values'])
+
+    def generate_guidance(self, observer, ethics):
+        return ethics['values'].get('care')
+
+
+def test_results_ignore_inputs_mutated_after_synthesize():
+    observer = {'insights': ['attention']}
+    ethics = {'values': {'care': 1.0}}
+    synthesis = StubSynthesizer().synthesize_wisdom(observer, ethics)
+
+    observer['insights'].append('bias')
+    ethics['values']['care'] = 0.0
+    ethics['values']['harm'] = 1.0
+
+    assert synthesis.integrated_understanding == ['attention']
+    assert synthesis.practical_wisdom == 2
+    assert synthesis.value_synthesis == ['care']
+    assert synthesis.action_guidance == 1.0